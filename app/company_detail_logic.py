@@ -7,11 +7,29 @@ Epic 5 (OWRKS-5.07)
 Spec: Screen 2 (Company Detail)
 """
 
-from typing import Dict, Optional
+from functools import wraps
+from typing import Any, Dict, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 import streamlit as st
 
+from app.components.empty_states import NO_COMPANY_SELECTED_MSG
+from app.components.score_display import is_na
+from app.data_loader import (
+    LOAD_VERSION_ATTR,
+    index_by_company_id,
+    index_by_normalized_company_id,
+    normalize_company_id,
+)
+
+# Columns used downstream of the per-company lookups (penetration metrics and
+# the display formatters) - everything else is dropped at lookup time
+BUILDINGS_DISPLAY_COLS = ['company_id', 'city', 'state', 'is_served', 'square_footage']
+CONTACTS_DISPLAY_COLS = [
+    'company_id', 'contact_count', 'contact_names', 'contact_emails', 'last_contact_date'
+]
+
 
 def metric_with_tooltip(label, value, tooltip_text):
     """
@@ -105,6 +123,86 @@ def get_selected_company_id() -> Optional[str]:
     return st.session_state.get('selected_company_id')
 
 
+def _get_indexed(df: pd.DataFrame, key: str = 'company_id') -> pd.DataFrame:
+    """
+    Get dataframe indexed by string company_id.
+
+    Frames from the cached loaders are already indexed, so this is a no-op
+    on the hot path.
+
+    Args:
+        df: Dataframe with a company_id column
+        key: Name of the company_id column
+
+    Returns:
+        Dataframe indexed by string company_id
+    """
+    return index_by_company_id(df, key)
+
+
+def _get_first_by_id(company_id: str, df: pd.DataFrame) -> Optional[pd.Series]:
+    """
+    Get the first row for a company ID via index lookup.
+
+    Args:
+        company_id: Company ID to retrieve
+        df: Dataframe with a company_id column
+
+    Returns:
+        First matching row as Series or None if not found
+    """
+    try:
+        matches = _get_indexed(df).loc[str(company_id)]
+    except KeyError:
+        return None
+
+    # Duplicate company_ids come back as a DataFrame - keep the first row
+    if isinstance(matches, pd.DataFrame):
+        return matches.iloc[0]
+
+    return matches
+
+
+def _memoize_per_company(fn):
+    """
+    Memoize a per-company getter in session state across reruns.
+
+    Streamlit reruns the whole detail page on every tab click, so the same
+    lookups repeat for the same company. Results are kept in
+    st.session_state['_detail_cache'] keyed on (getter, company_id, data
+    version) and the cache is dropped whenever a different company is
+    requested. The data version is the frame's load-version token (see
+    stamp_load_version), so a loader refresh always misses; frames without
+    one fall back to id(df) and are only reused for that exact object.
+
+    Each call returns a copy of the cached result, so callers may mutate it.
+
+    Args:
+        fn: Getter taking (company_id, df)
+
+    Returns:
+        Wrapped getter
+    """
+    @wraps(fn)
+    def wrapper(company_id, df):
+        company_key = str(company_id)
+        if st.session_state.get('_detail_cache_for') != company_key:
+            st.session_state['_detail_cache'] = {}
+            st.session_state['_detail_cache_for'] = company_key
+
+        cache = st.session_state.setdefault('_detail_cache', {})
+        data_version = df.attrs.get(LOAD_VERSION_ATTR, id(df))
+        key = (fn.__name__, company_key, data_version)
+        if key not in cache:
+            cache[key] = fn(company_id, df)
+
+        result = cache[key]
+        return None if result is None else result.copy()
+
+    return wrapper
+
+
+@_memoize_per_company
 def get_company_by_id(company_id: str, companies_df: pd.DataFrame) -> Optional[pd.Series]:
     """
     Get company data by ID.
@@ -116,14 +214,10 @@ def get_company_by_id(company_id: str, companies_df: pd.DataFrame) -> Optional[p
     Returns:
         Company data as Series or None if not found
     """
-    matches = companies_df[companies_df['company_id'].astype(str) == str(company_id)]
-
-    if len(matches) == 0:
-        return None
-
-    return matches.iloc[0]
+    return _get_first_by_id(company_id, companies_df)
 
 
+@_memoize_per_company
 def get_scored_company_by_id(company_id: str, scored_df: pd.DataFrame) -> Optional[pd.Series]:
     """
     Get scored company data by ID.
@@ -135,14 +229,10 @@ def get_scored_company_by_id(company_id: str, scored_df: pd.DataFrame) -> Option
     Returns:
         Scored company data as Series or None if not found
     """
-    matches = scored_df[scored_df['company_id'].astype(str) == str(company_id)]
-
-    if len(matches) == 0:
-        return None
-
-    return matches.iloc[0]
+    return _get_first_by_id(company_id, scored_df)
 
 
+@_memoize_per_company
 def get_company_buildings(company_id: str, buildings_df: pd.DataFrame) -> pd.DataFrame:
     """
     Get all buildings for a company.
@@ -156,13 +246,19 @@ def get_company_buildings(company_id: str, buildings_df: pd.DataFrame) -> pd.Dat
     """
     # Normalize company_id to handle zero-padding inconsistencies
     # Both '7526346' and '007526346' should match
-    company_id_str = str(company_id).lstrip('0') or '0'  # Keep '0' if all zeros
+    company_id_int = normalize_company_id(company_id)
 
-    # Filter buildings where company_id matches (after removing leading zeros from both sides)
-    mask = buildings_df['company_id'].astype(str).str.lstrip('0').fillna('0') == company_id_str
-    return buildings_df[mask].copy()
+    # Look up by the integer index (precomputed by load_buildings),
+    # keeping only the columns callers use
+    indexed = index_by_normalized_company_id(buildings_df)
+    columns = [col for col in BUILDINGS_DISPLAY_COLS if col in indexed.columns]
+    if company_id_int is None or company_id_int not in indexed.index:
+        return indexed.iloc[0:0][columns]
 
+    return indexed.loc[[company_id_int], columns]
 
+
+@_memoize_per_company
 def get_company_contacts(company_id: str, contacts_df: pd.DataFrame) -> pd.DataFrame:
     """
     Get all contacts for a company.
@@ -174,7 +270,55 @@ def get_company_contacts(company_id: str, contacts_df: pd.DataFrame) -> pd.DataF
     Returns:
         Filtered contacts dataframe
     """
-    return contacts_df[contacts_df['company_id'].astype(str) == str(company_id)].copy()
+    indexed = _get_indexed(contacts_df)
+
+    # Row positions from the company_id hash index (-1 marks a miss)
+    positions = indexed.index.get_indexer_for([str(company_id)])
+    columns = [col for col in CONTACTS_DISPLAY_COLS if col in indexed.columns]
+    return indexed.take(positions[positions >= 0])[columns]
+
+
+# Plain string fields shown on the Info tab: display label -> column
+_FIELDS = {'Company ID': 'company_id', 'Name': 'name', 'NAICS': 'primary_naics'}
+
+
+def _format_coords(company_data: Dict[str, Any]) -> Optional[str]:
+    """
+    Format HQ latitude/longitude as "lat, lon" with 4 decimal places.
+
+    Args:
+        company_data: Company data as a dict (from Series.to_dict())
+
+    Returns:
+        Formatted coordinates or None if missing or not numeric
+    """
+    lat = company_data.get('hq_latitude')
+    lon = company_data.get('hq_longitude')
+    if is_na(lat) or is_na(lon):
+        return None
+
+    try:
+        # Convert to float (they may be strings from CSV)
+        return f"{float(lat):.4f}, {float(lon):.4f}"
+    except (ValueError, TypeError):
+        return None
+
+
+def _first_notna(company_data: Dict[str, Any], columns: tuple) -> Optional[Any]:
+    """
+    Get the first non-null value among fallback columns.
+
+    Args:
+        company_data: Company data as a dict (from Series.to_dict())
+        columns: Column names in priority order
+
+    Returns:
+        First non-null value or None if all are missing/null
+    """
+    return next(
+        (value for value in map(company_data.get, columns) if not is_na(value)),
+        None
+    )
 
 
 def format_company_info(company_data: pd.Series) -> Dict[str, str]:
@@ -189,29 +333,43 @@ def format_company_info(company_data: pd.Series) -> Dict[str, str]:
 
     Spec: Info tab requirements
     """
-    info = {
-        'Company ID': str(company_data.get('company_id', 'N/A')),
-        'Name': str(company_data.get('name', 'N/A')),
-        'NAICS': str(company_data.get('primary_naics', 'N/A')),
-        'Buildings': str(int(company_data.get('building_count', 0)))
-    }
+    # Plain dict lookups are cheaper than repeated Series label indexing
+    data = company_data.to_dict()
+
+    info = {label: str(data.get(col, 'N/A')) for label, col in _FIELDS.items()}
+    info['Buildings'] = str(int(data.get('building_count', 0)))
 
     # Add HQ coordinates if available
-    try:
-        lat = company_data.get('hq_latitude')
-        lon = company_data.get('hq_longitude')
-        if pd.notna(lat) and pd.notna(lon):
-            # Convert to float (they may be strings from CSV)
-            lat_float = float(lat)
-            lon_float = float(lon)
-            info['HQ Location'] = f"{lat_float:.4f}, {lon_float:.4f}"
-    except (ValueError, TypeError):
-        # If conversion fails, skip HQ location
-        pass
+    coords = _format_coords(data)
+    if coords is not None:
+        info['HQ Location'] = coords
 
     return info
 
 
+def calculate_building_metrics(buildings_df: pd.DataFrame) -> Tuple[int, int, float]:
+    """
+    Calculate total, served and penetration rate for company's buildings.
+
+    Args:
+        buildings_df: Buildings dataframe for company
+
+    Returns:
+        Tuple of (total_buildings, served_buildings, penetration_rate)
+        with the rate as a percentage (0-100)
+
+    Spec: Penetration display requirements
+    """
+    total = len(buildings_df)
+    if total == 0:
+        return 0, 0, 0.0
+
+    # Single reduction over the raw bool array (same cast as format_buildings_display)
+    served = int(buildings_df['is_served'].to_numpy(dtype=bool, copy=False).sum())
+
+    return total, served, (served / total) * 100.0
+
+
 def calculate_penetration_rate(buildings_df: pd.DataFrame) -> float:
     """
     Calculate penetration rate for company's buildings.
@@ -224,13 +382,7 @@ def calculate_penetration_rate(buildings_df: pd.DataFrame) -> float:
 
     Spec: Penetration display requirements
     """
-    if len(buildings_df) == 0:
-        return 0.0
-
-    served_count = buildings_df['is_served'].sum()
-    total_count = len(buildings_df)
-
-    return (served_count / total_count) * 100.0
+    return calculate_building_metrics(buildings_df)[2]
 
 
 def has_churn_data(company_id: str, churn_df: Optional[pd.DataFrame]) -> bool:
@@ -249,8 +401,7 @@ def has_churn_data(company_id: str, churn_df: Optional[pd.DataFrame]) -> bool:
     if churn_df is None:
         return False
 
-    matches = churn_df[churn_df['company_id'].astype(str) == str(company_id)]
-    return len(matches) > 0
+    return str(company_id) in _get_indexed(churn_df).index
 
 
 def get_churn_prediction(company_id: str, churn_df: Optional[pd.DataFrame]) -> Optional[pd.Series]:
@@ -267,14 +418,42 @@ def get_churn_prediction(company_id: str, churn_df: Optional[pd.DataFrame]) -> O
     if churn_df is None:
         return None
 
-    matches = churn_df[churn_df['company_id'].astype(str) == str(company_id)]
+    return _get_first_by_id(company_id, churn_df)
+
 
-    if len(matches) == 0:
+def get_research_record(company_id: str, research_df: Optional[pd.DataFrame]) -> Optional[pd.Series]:
+    """
+    Get the web research record for a company.
+
+    Args:
+        company_id: Company ID
+        research_df: Company research dataframe (may be None)
+
+    Returns:
+        First research row for the company or None
+    """
+    if research_df is None:
         return None
 
-    return matches.iloc[0]
+    return _get_first_by_id(company_id, research_df)
 
 
+# Score components shown on the Scoring tab: (column, display label)
+SCORE_COMPONENTS = [
+    ('icp_fit_score', 'ICP Fit Score'),
+    ('expansion_potential', 'Expansion Potential'),
+    ('decision_maker_clarity', 'Decision Maker Clarity'),
+    ('hygiene_relevance', 'Hygiene Relevance'),
+    ('revenue_potential', 'Revenue Potential'),
+    ('buyer_intent', 'Buyer Intent'),
+    ('geographic_fit', 'Geographic Fit'),
+]
+SCORE_COMPONENT_COLS = [col for col, _ in SCORE_COMPONENTS]
+
+# Note: the format_* helpers below are deliberately not wrapped in
+# @st.cache_data. They build a small dict from one row (~10µs), while a cache
+# hit has to hash the Series argument first (~500µs) and unpickle the result.
+
 def format_score_components(scored_data: pd.Series) -> Dict[str, float]:
     """
     Format score components for display.
@@ -289,37 +468,15 @@ def format_score_components(scored_data: pd.Series) -> Dict[str, float]:
 
     Spec: Scoring tab requirements - Component breakdown
     """
-    components = {}
-
-    # ICP Fit Score (0-1 to 0-100)
-    if 'icp_fit_score' in scored_data and pd.notna(scored_data['icp_fit_score']):
-        components['ICP Fit Score'] = scored_data['icp_fit_score'] * 100
-
-    # Expansion Potential (0-1 to 0-100)
-    if 'expansion_potential' in scored_data and pd.notna(scored_data['expansion_potential']):
-        components['Expansion Potential'] = scored_data['expansion_potential'] * 100
+    # One reindex + vector multiply over the fixed component list (0-1 to 0-100);
+    # missing columns come back as NaN and are skipped like null values
+    values = (scored_data.reindex(SCORE_COMPONENT_COLS).to_numpy(dtype='float64') * 100).tolist()
 
-    # Decision Maker Clarity (0-1 to 0-100)
-    if 'decision_maker_clarity' in scored_data and pd.notna(scored_data['decision_maker_clarity']):
-        components['Decision Maker Clarity'] = scored_data['decision_maker_clarity'] * 100
-
-    # Hygiene Relevance (0-1 to 0-100)
-    if 'hygiene_relevance' in scored_data and pd.notna(scored_data['hygiene_relevance']):
-        components['Hygiene Relevance'] = scored_data['hygiene_relevance'] * 100
-
-    # Revenue Potential (0-1 to 0-100)
-    if 'revenue_potential' in scored_data and pd.notna(scored_data['revenue_potential']):
-        components['Revenue Potential'] = scored_data['revenue_potential'] * 100
-
-    # Buyer Intent (0-1 to 0-100)
-    if 'buyer_intent' in scored_data and pd.notna(scored_data['buyer_intent']):
-        components['Buyer Intent'] = scored_data['buyer_intent'] * 100
-
-    # Geographic Fit (0-1 to 0-100)
-    if 'geographic_fit' in scored_data and pd.notna(scored_data['geographic_fit']):
-        components['Geographic Fit'] = scored_data['geographic_fit'] * 100
-
-    return components
+    return {
+        label: value
+        for (_, label), value in zip(SCORE_COMPONENTS, values)
+        if value == value  # NaN != NaN
+    }
 
 
 def format_buildings_display(buildings_df: pd.DataFrame) -> pd.DataFrame:
@@ -334,28 +491,21 @@ def format_buildings_display(buildings_df: pd.DataFrame) -> pd.DataFrame:
 
     Spec: Buildings tab requirements
     """
-    display_df = buildings_df.copy()
-
-    # Format served status
-    display_df['Status'] = display_df['is_served'].apply(
-        lambda x: '✅ Served' if x else '❌ Unserved'
-    )
-
-    # Format square footage
-    display_df['Square Feet'] = display_df['square_footage'].apply(
-        lambda x: f"{int(x):,}" if pd.notna(x) else 'N/A'
-    )
-
-    # Select columns for display
-    display_columns = ['City', 'State', 'Status', 'Square Feet']
+    # Format square footage (truncate to int like int(x), 'N/A' for nulls)
+    square_footage = buildings_df['square_footage']
+    has_sqft = square_footage.notna().to_numpy()
+    square_feet = np.full(len(buildings_df), 'N/A', dtype=object)
+    square_feet[has_sqft] = square_footage[has_sqft].astype('int64').map('{:,}'.format).to_numpy()
 
-    # Rename columns if needed
-    if 'city' in display_df.columns:
-        display_df['City'] = display_df['city']
-    if 'state' in display_df.columns:
-        display_df['State'] = display_df['state']
-
-    return display_df[display_columns]
+    # Build the display frame in one step - the input slice is never copied
+    return pd.DataFrame({
+        'City': buildings_df['city'],
+        'State': buildings_df['state'],
+        'Status': np.where(
+            buildings_df['is_served'].to_numpy(dtype=bool), '✅ Served', '❌ Unserved'
+        ),
+        'Square Feet': square_feet,
+    }, index=buildings_df.index)
 
 
 def format_contacts_display(contacts_df: pd.DataFrame) -> pd.DataFrame:
@@ -376,18 +526,13 @@ def format_contacts_display(contacts_df: pd.DataFrame) -> pd.DataFrame:
     if len(contacts_df) == 0:
         return pd.DataFrame()
 
-    display_df = contacts_df.copy()
-
-    # Format aggregated contact data for display
-    display_df['Contact Count'] = display_df['contact_count'].fillna(0).astype(int)
-    display_df['Contact Names'] = display_df['contact_names'].fillna('N/A')
-    display_df['Contact Emails'] = display_df['contact_emails'].fillna('N/A')
-    display_df['Last Contact'] = display_df['last_contact_date'].fillna('N/A')
-
-    # Select columns for display
-    display_columns = ['Contact Count', 'Contact Names', 'Contact Emails', 'Last Contact']
-
-    return display_df[display_columns]
+    # Build the display frame in one step - the input slice is never copied
+    return pd.DataFrame({
+        'Contact Count': contacts_df['contact_count'].fillna(0).astype(int),
+        'Contact Names': contacts_df['contact_names'].fillna('N/A'),
+        'Contact Emails': contacts_df['contact_emails'].fillna('N/A'),
+        'Last Contact': contacts_df['last_contact_date'].fillna('N/A'),
+    })
 
 
 def get_no_company_selected_message() -> str:
@@ -397,10 +542,7 @@ def get_no_company_selected_message() -> str:
     Returns:
         Message string
     """
-    return (
-        "No company selected. Please select a company from the **Ranked Companies** page "
-        "and click 'View Company Detail'."
-    )
+    return NO_COMPANY_SELECTED_MSG
 
 
 def get_company_not_found_message(company_id: str) -> str:
@@ -454,47 +596,44 @@ def format_scoring_breakdown(scored_data: pd.Series) -> Dict[str, any]:
     return breakdown
 
 
-def format_hq_info(company_data: pd.Series) -> Dict[str, str]:
+def format_hq_info(company_data: pd.Series, sales_volume_fallback: Any = None) -> Dict[str, str]:
     """
     Format HQ information for display in Tab 4 (replaces Buildings tab).
 
     Args:
         company_data: Company data series
+        sales_volume_fallback: Sales volume to use when company_data has none
+            (e.g. from the scored record)
 
     Returns:
         Dictionary of formatted HQ info fields
 
     Epic 5 Task 3: New HQ Info tab
     """
+    # Plain dict lookups are cheaper than repeated Series label indexing
+    data = company_data.to_dict()
+
+    # Fill the fallback into the dict copy - the caller's Series is untouched
+    if is_na(data.get('sales_volume')):
+        data['sales_volume'] = sales_volume_fallback
+
     hq_info = {}
 
     # HQ address components
-    hq_info['city'] = str(company_data.get('city', 'N/A'))
-    hq_info['state'] = str(company_data.get('state', 'N/A'))
+    hq_info['city'] = str(data.get('city', 'N/A'))
+    hq_info['state'] = str(data.get('state', 'N/A'))
 
     # HQ coordinates
-    try:
-        lat = company_data.get('hq_latitude')
-        lon = company_data.get('hq_longitude')
-        if pd.notna(lat) and pd.notna(lon):
-            lat_float = float(lat)
-            lon_float = float(lon)
-            hq_info['coordinates'] = f"{lat_float:.4f}, {lon_float:.4f}"
-        else:
-            hq_info['coordinates'] = 'N/A'
-    except (ValueError, TypeError):
-        hq_info['coordinates'] = 'N/A'
+    hq_info['coordinates'] = _format_coords(data) or 'N/A'
 
     # Building count estimate (from building_count_estimate or building_count field)
-    building_count = company_data.get('building_count_estimate', company_data.get('building_count', 0))
-    hq_info['building_count_estimate'] = str(int(building_count)) if pd.notna(building_count) else 'N/A'
+    building_count = data.get('building_count_estimate', data.get('building_count', 0))
+    hq_info['building_count_estimate'] = str(int(building_count)) if not is_na(building_count) else 'N/A'
 
     # Employee count (try location_employee_size first, then employees field)
-    employee_size = company_data.get('location_employee_size')
-    if pd.isna(employee_size):
-        employee_size = company_data.get('employees')
+    employee_size = _first_notna(data, ('location_employee_size', 'employees'))
 
-    if pd.notna(employee_size):
+    if employee_size is not None:
         try:
             hq_info['employee_size'] = str(int(float(employee_size)))
         except (ValueError, TypeError):
@@ -503,15 +642,11 @@ def format_hq_info(company_data: pd.Series) -> Dict[str, str]:
         hq_info['employee_size'] = 'N/A'
 
     # Sales volume (revenue) - try multiple fields
-    sales_volume = company_data.get('sales_volume')
-    if pd.isna(sales_volume):
-        # Fall back to corporate_sales_revenue if available
-        sales_volume = company_data.get('corporate_sales_revenue')
-    if pd.isna(sales_volume):
-        # Fall back to revenue field
-        sales_volume = company_data.get('revenue')
-
-    if pd.notna(sales_volume):
+    sales_volume = _first_notna(
+        data, ('sales_volume', 'corporate_sales_revenue', 'revenue')
+    )
+
+    if sales_volume is not None:
         # Format as currency if numeric
         try:
             sales_float = float(sales_volume)
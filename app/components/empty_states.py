@@ -7,17 +7,27 @@ Epic 5 (OWRKS-5.11)
 Spec: §5.5 (Silent Failures), Navigation & Error Handling
 """
 
-import streamlit as st
+# streamlit is imported inside the render_* functions so the message
+# constants can be imported without it
+
+# Standard messages per spec §5.5 - import these directly; the getters
+# below are kept for existing callers
+EMPTY_COMPANIES_MSG = "No companies match the current filters. Try adjusting your selection."
+NO_BUILDINGS_MSG = "No buildings found for this company."
+NO_CONTACTS_MSG = "No contact history available."
+NO_RESEARCH_MSG = "Research not available for this company."
+CHURN_PENDING_MSG = "Churn predictions pending."
+NO_VALID_COORDINATES_MSG = "No buildings with valid coordinates match current filters."
+NO_COMPANY_SELECTED_MSG = "No company selected. Please select a company from the **Ranked Companies** page and click 'View Company Detail'."
 
-# Standard messages per spec §5.5
 STANDARD_MESSAGES = {
-    'empty_companies': "No companies match the current filters. Try adjusting your selection.",
-    'no_buildings': "No buildings found for this company.",
-    'no_contacts': "No contact history available.",
-    'no_research': "Research not available for this company.",
-    'churn_pending': "Churn predictions pending.",
-    'no_valid_coordinates': "No buildings with valid coordinates match current filters.",
-    'no_company_selected': "No company selected. Please select a company from the **Ranked Companies** page and click 'View Company Detail'.",
+    'empty_companies': EMPTY_COMPANIES_MSG,
+    'no_buildings': NO_BUILDINGS_MSG,
+    'no_contacts': NO_CONTACTS_MSG,
+    'no_research': NO_RESEARCH_MSG,
+    'churn_pending': CHURN_PENDING_MSG,
+    'no_valid_coordinates': NO_VALID_COORDINATES_MSG,
+    'no_company_selected': NO_COMPANY_SELECTED_MSG,
 }
 
 
@@ -30,7 +40,7 @@ def get_empty_companies_message() -> str:
 
     Spec: §5.5 Standard empty state messages
     """
-    return STANDARD_MESSAGES['empty_companies']
+    return EMPTY_COMPANIES_MSG
 
 
 def get_no_buildings_message() -> str:
@@ -42,7 +52,7 @@ def get_no_buildings_message() -> str:
 
     Spec: §5.5 Standard empty state messages
     """
-    return STANDARD_MESSAGES['no_buildings']
+    return NO_BUILDINGS_MSG
 
 
 def get_no_contacts_message() -> str:
@@ -54,7 +64,7 @@ def get_no_contacts_message() -> str:
 
     Spec: §5.5 Standard empty state messages
     """
-    return STANDARD_MESSAGES['no_contacts']
+    return NO_CONTACTS_MSG
 
 
 def get_no_research_message() -> str:
@@ -66,7 +76,7 @@ def get_no_research_message() -> str:
 
     Spec: §5.5 Standard empty state messages
     """
-    return STANDARD_MESSAGES['no_research']
+    return NO_RESEARCH_MSG
 
 
 def get_churn_pending_message() -> str:
@@ -78,7 +88,7 @@ def get_churn_pending_message() -> str:
 
     Spec: §5.5 Standard empty state messages
     """
-    return STANDARD_MESSAGES['churn_pending']
+    return CHURN_PENDING_MSG
 
 
 def get_no_valid_coordinates_message() -> str:
@@ -90,7 +100,7 @@ def get_no_valid_coordinates_message() -> str:
 
     Spec: §5.5 Standard empty state messages
     """
-    return STANDARD_MESSAGES['no_valid_coordinates']
+    return NO_VALID_COORDINATES_MSG
 
 
 def get_no_company_selected_message() -> str:
@@ -102,7 +112,7 @@ def get_no_company_selected_message() -> str:
 
     Spec: Navigation requirement - Company Detail empty state
     """
-    return STANDARD_MESSAGES['no_company_selected']
+    return NO_COMPANY_SELECTED_MSG
 
 
 def get_company_not_found_message(company_id: str) -> str:
@@ -129,6 +139,8 @@ def render_empty_table(message: str) -> None:
 
     Spec: §5.5 Empty table never renders without explanation
     """
+    import streamlit as st
+
     st.warning(message)
 
 
@@ -142,6 +154,8 @@ def render_error(title: str, details: str) -> None:
 
     Spec: Error handling - user-friendly error display
     """
+    import streamlit as st
+
     st.error(f"**{title}**")
     st.error(details)
 
@@ -155,6 +169,8 @@ def render_info(message: str) -> None:
 
     Spec: Informational messages
     """
+    import streamlit as st
+
     st.info(message)
 
 
@@ -227,6 +243,8 @@ def render_navigation_link(page_name: str, link_text: str = None) -> None:
 
     Spec: Navigation guidance
     """
+    import streamlit as st
+
     if link_text is None:
         link_text = f"Navigate to **{page_name}** using the sidebar."
 
@@ -8,12 +8,23 @@ Epic 5 (OWRKS-5.03)
 Spec: §2.1.3 (Filter State Consistency)
 """
 
-from typing import List, Optional
+from typing import Callable, Dict, List, Optional
 
+import numpy as np
 import pandas as pd
 import streamlit as st
 
 
+# Session state keys for every filter and their default ('all') values
+FILTER_DEFAULTS = {
+    'naics_filter': 'all',
+    'source_filter': 'all',
+    'channel_filter': 'all',
+    'research_filter': 'all',
+    'served_filter': 'all',
+}
+
+
 def init_filter_state():
     """
     Initialize all filter defaults in session state.
@@ -23,20 +34,8 @@ def init_filter_state():
 
     Spec: §2.1.3 Filter State Consistency
     """
-    if 'naics_filter' not in st.session_state:
-        st.session_state.naics_filter = 'all'
-
-    if 'source_filter' not in st.session_state:
-        st.session_state.source_filter = 'all'
-
-    if 'channel_filter' not in st.session_state:
-        st.session_state.channel_filter = 'all'
-
-    if 'research_filter' not in st.session_state:
-        st.session_state.research_filter = 'all'
-
-    if 'served_filter' not in st.session_state:
-        st.session_state.served_filter = 'all'
+    for key, default in FILTER_DEFAULTS.items():
+        st.session_state.setdefault(key, default)
 
 
 def get_unique_naics(df: pd.DataFrame) -> List[str]:
@@ -73,6 +72,68 @@ def get_unique_channels(df: pd.DataFrame) -> List[str]:
     return sorted(channels)
 
 
+# Filter columns in evaluation order, most selective first: a single channel
+# or NAICS code usually keeps a small slice, source and the boolean flags
+# roughly halve the frame
+FILTER_EVALUATION_ORDER = ['channel_id', 'primary_naics', 'source', 'has_research_doc', 'is_served']
+
+# Once fewer than this fraction of rows survive, the remaining predicates are
+# evaluated on the surviving rows only instead of on whole columns
+NARROW_FRACTION = 0.1
+
+
+def get_active_filter_predicates(columns) -> Dict[str, Callable[[pd.Series], pd.Series]]:
+    """
+    Build the predicates for filters that are active in session state.
+
+    Filters whose column is missing from the dataframe are skipped.
+
+    Args:
+        columns: Columns of the dataframe being filtered
+
+    Returns:
+        Dictionary of column name to predicate returning a boolean Series
+
+    Spec: §2.1.3 Filter State Consistency
+    """
+    predicates = {}
+
+    # NAICS filter (single code or list of codes)
+    naics_filter = st.session_state.get('naics_filter', 'all')
+    if 'primary_naics' in columns and naics_filter != 'all':
+        # Build the lookup Index once rather than letting isin convert the list
+        naics_codes = pd.Index(naics_filter if isinstance(naics_filter, list) else [naics_filter])
+        predicates['primary_naics'] = lambda s: s.isin(naics_codes)
+
+    # Source filter
+    source_filter = st.session_state.get('source_filter', 'all')
+    if 'source' in columns and source_filter != 'all':
+        predicates['source'] = lambda s: s == source_filter
+
+    # Channel filter
+    channel_filter = st.session_state.get('channel_filter', 'all')
+    if 'channel_id' in columns and channel_filter != 'all':
+        predicates['channel_id'] = lambda s: s == channel_filter
+
+    # Research filter
+    research_filter = st.session_state.get('research_filter', 'all')
+    if 'has_research_doc' in columns:
+        if research_filter == 'has_research':
+            predicates['has_research_doc'] = lambda s: s == True
+        elif research_filter == 'no_research':
+            predicates['has_research_doc'] = lambda s: s == False
+
+    # Served filter (for buildings dataframe)
+    served_filter = st.session_state.get('served_filter', 'all')
+    if 'is_served' in columns:
+        if served_filter == 'served':
+            predicates['is_served'] = lambda s: s == True
+        elif served_filter == 'unserved':
+            predicates['is_served'] = lambda s: s == False
+
+    return predicates
+
+
 def apply_filters(df: pd.DataFrame) -> pd.DataFrame:
     """
     Apply active filters to DataFrame based on session state.
@@ -84,6 +145,10 @@ def apply_filters(df: pd.DataFrame) -> pd.DataFrame:
     - Research status (has_research/no_research/all)
     - Served status (served/unserved/all) - for buildings only
 
+    Filters are evaluated most selective first (FILTER_EVALUATION_ORDER) and
+    combined into one mask; once the surviving rows drop below
+    NARROW_FRACTION, the remaining filters only look at those rows.
+
     Args:
         df: DataFrame to filter
 
@@ -92,48 +157,27 @@ def apply_filters(df: pd.DataFrame) -> pd.DataFrame:
 
     Spec: §2.1.3 Filter State Consistency
     """
-    filtered_df = df.copy()
-
-    # NAICS filter
-    if 'primary_naics' in filtered_df.columns:
-        naics_filter = st.session_state.get('naics_filter', 'all')
-        if naics_filter != 'all':
-            if isinstance(naics_filter, list):
-                # Multiple NAICS codes selected
-                filtered_df = filtered_df[filtered_df['primary_naics'].isin(naics_filter)]
-            else:
-                # Single NAICS code selected
-                filtered_df = filtered_df[filtered_df['primary_naics'] == naics_filter]
+    predicates = get_active_filter_predicates(df.columns)
 
-    # Source filter
-    if 'source' in filtered_df.columns:
-        source_filter = st.session_state.get('source_filter', 'all')
-        if source_filter != 'all':
-            filtered_df = filtered_df[filtered_df['source'] == source_filter]
+    mask = np.ones(len(df), dtype=bool)
+    positions = None  # Row positions once the selection has been narrowed
 
-    # Channel filter
-    if 'channel_id' in filtered_df.columns:
-        channel_filter = st.session_state.get('channel_filter', 'all')
-        if channel_filter != 'all':
-            filtered_df = filtered_df[filtered_df['channel_id'] == channel_filter]
+    for column in FILTER_EVALUATION_ORDER:
+        if column not in predicates:
+            continue
 
-    # Research filter
-    if 'has_research_doc' in filtered_df.columns:
-        research_filter = st.session_state.get('research_filter', 'all')
-        if research_filter == 'has_research':
-            filtered_df = filtered_df[filtered_df['has_research_doc'] == True]
-        elif research_filter == 'no_research':
-            filtered_df = filtered_df[filtered_df['has_research_doc'] == False]
+        predicate = predicates[column]
+        if positions is None:
+            mask &= predicate(df[column]).to_numpy()
+            if mask.sum() < NARROW_FRACTION * len(df):
+                positions = np.flatnonzero(mask)
+        else:
+            positions = positions[predicate(df[column].take(positions)).to_numpy()]
 
-    # Served filter (for buildings dataframe)
-    if 'is_served' in filtered_df.columns:
-        served_filter = st.session_state.get('served_filter', 'all')
-        if served_filter == 'served':
-            filtered_df = filtered_df[filtered_df['is_served'] == True]
-        elif served_filter == 'unserved':
-            filtered_df = filtered_df[filtered_df['is_served'] == False]
+    if positions is None:
+        return df.loc[mask]
 
-    return filtered_df
+    return df.take(positions)
 
 
 def reset_filters():
@@ -142,11 +186,7 @@ def reset_filters():
 
     Spec: §2.1.3 Filter State Consistency
     """
-    st.session_state.naics_filter = 'all'
-    st.session_state.source_filter = 'all'
-    st.session_state.channel_filter = 'all'
-    st.session_state.research_filter = 'all'
-    st.session_state.served_filter = 'all'
+    st.session_state.update(FILTER_DEFAULTS)
 
 
 def render_naics_filter(df: pd.DataFrame, key: str = "naics_filter_widget"):
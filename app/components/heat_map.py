@@ -8,10 +8,41 @@ Epic 5 (OWRKS-5.10)
 Spec: §2.1.2 (Geo-coordinate Validity), §4.1 (Performance Gates)
 """
 
-from typing import Dict, Optional, Tuple
+from typing import Any, Dict, Optional, Tuple
 
 import folium
+import numpy as np
 import pandas as pd
+import xyzservices
+from folium.plugins import FastMarkerCluster
+
+from app.components.score_display import is_na
+
+# Tile provider for the base map. tiles='OpenStreetMap' resolves to this same
+# provider, but folium searches the whole xyzservices catalog for the name on
+# every map - ~90% of the cost of building a base map
+BASE_TILES = xyzservices.providers.OpenStreetMap.Mapnik
+
+# Above this many markers the map switches from one CircleMarker object per
+# company to a clustered, browser-rendered FastMarkerCluster
+FAST_MARKER_THRESHOLD = 1000
+
+# Builds the same circle marker as create_us_heat_map's per-marker path from a
+# [lat, lon, color, tooltip] row
+FAST_MARKER_CALLBACK = """
+var callback = function (row) {
+    var marker = L.circleMarker(new L.LatLng(row[0], row[1]), {
+        radius: 5,
+        color: row[2],
+        fill: true,
+        fillColor: row[2],
+        fillOpacity: 0.7
+    });
+    marker.bindPopup(row[3]);
+    marker.bindTooltip(row[3]);
+    return marker;
+};
+"""
 
 
 def validate_coordinates(latitude: any, longitude: any) -> Tuple[bool, Optional[str]]:
@@ -28,7 +59,7 @@ def validate_coordinates(latitude: any, longitude: any) -> Tuple[bool, Optional[
     Spec: §2.1.2 Geo-coordinate Validity
     """
     # Check for missing coordinates
-    if pd.isna(latitude) or pd.isna(longitude):
+    if is_na(latitude) or is_na(longitude):
         return False, "Coordinates missing"
 
     try:
@@ -61,13 +92,14 @@ def filter_valid_coordinates(
 
     Spec: §2.1.2 Geo-coordinate Validity, coordinate exclusion logging
     """
-    valid_mask = buildings_df.apply(
-        lambda row: validate_coordinates(row['latitude'], row['longitude'])[0],
-        axis=1
-    )
+    # Vectorized equivalent of validate_coordinates over whole columns:
+    # non-numeric values coerce to NaN and fail the range checks
+    lat = pd.to_numeric(buildings_df['latitude'], errors='coerce')
+    lon = pd.to_numeric(buildings_df['longitude'], errors='coerce')
+    valid_mask = (lat.between(-90, 90) & lon.between(-180, 180)).to_numpy()
 
-    valid_buildings = buildings_df[valid_mask].copy()
-    excluded_buildings = buildings_df[~valid_mask].copy()
+    valid_buildings = buildings_df.loc[valid_mask]
+    excluded_buildings = buildings_df.loc[~valid_mask]
 
     return valid_buildings, excluded_buildings
 
@@ -93,7 +125,11 @@ def get_exclusion_summary(excluded_df: pd.DataFrame) -> Dict:
             }
         }
 
-    by_source = excluded_df.groupby('source').size().to_dict()
+    # Scored companies carry no 'source' column - count them as unattributed
+    if 'source' in excluded_df.columns:
+        by_source = excluded_df['source'].value_counts().to_dict()
+    else:
+        by_source = {}
 
     return {
         'total': len(excluded_df),
@@ -147,6 +183,46 @@ def get_marker_color(
     return 'blue'
 
 
+def compute_colors(
+    color_mode: str,
+    is_customer: np.ndarray,
+    has_research: np.ndarray,
+    score: np.ndarray
+) -> np.ndarray:
+    """
+    Get marker colors for many markers at once.
+
+    Vectorized equivalent of get_marker_color over parallel arrays.
+
+    Args:
+        color_mode: 'customer_status', 'research_status', or 'score_tier'
+        is_customer: Whether each company is a customer
+        has_research: Whether each company has a research document
+        score: Final score (0-100) per company
+
+    Returns:
+        Array of color strings, one per marker
+
+    Epic 5: Updated heat map with multiple color modes
+    """
+    if color_mode == 'customer_status':
+        return np.where(np.asarray(is_customer, dtype=bool), 'green', 'red')
+
+    if color_mode == 'research_status':
+        return np.where(np.asarray(has_research, dtype=bool), 'blue', 'gray')
+
+    if color_mode == 'score_tier':
+        score = np.asarray(score, dtype=float)
+        return np.select(
+            [score >= 80, score >= 60, score >= 40],
+            ['green', 'gold', 'orange'],  # Folium uses 'gold' for yellow
+            default='red'
+        )
+
+    # Default fallback
+    return np.full(len(score), 'blue')
+
+
 def format_tooltip(
     company_name: str,
     city: str,
@@ -207,8 +283,9 @@ def create_base_map() -> folium.Map:
     m = folium.Map(
         location=[center['lat'], center['lon']],
         zoom_start=center['zoom'],
-        tiles='OpenStreetMap'
+        tiles=None
     )
+    folium.TileLayer(BASE_TILES, name='openstreetmap').add_to(m)
 
     return m
 
@@ -225,20 +302,20 @@ def filter_by_served_status(
         served_filter: 'all', 'served', or 'unserved'
 
     Returns:
-        Filtered dataframe
+        Filtered dataframe (not a copy - the input itself for 'all')
 
     Spec: Served status filter requirement
     """
     if served_filter == 'all':
-        return buildings_df.copy()
+        return buildings_df
 
     if served_filter == 'served':
-        return buildings_df[buildings_df['is_served'] == True].copy()
+        return buildings_df[buildings_df['is_served'] == True]
 
     if served_filter == 'unserved':
-        return buildings_df[buildings_df['is_served'] == False].copy()
+        return buildings_df[buildings_df['is_served'] == False]
 
-    return buildings_df.copy()
+    return buildings_df
 
 
 def filter_by_source(buildings_df: pd.DataFrame, source_filter: str) -> pd.DataFrame:
@@ -250,14 +327,45 @@ def filter_by_source(buildings_df: pd.DataFrame, source_filter: str) -> pd.DataF
         source_filter: 'all', 'dataaxle', or 'manual'
 
     Returns:
-        Filtered dataframe
+        Filtered dataframe (not a copy - the input itself for 'all')
 
     Spec: Source filter requirement
     """
     if source_filter == 'all':
-        return buildings_df.copy()
+        return buildings_df
+
+    return buildings_df[buildings_df['source'] == source_filter]
+
 
-    return buildings_df[buildings_df['source'] == source_filter].copy()
+def _column_values(df: pd.DataFrame, column: str, default: Any) -> np.ndarray:
+    """
+    Get a column as a numpy array, or a constant array if the column is missing.
+
+    Args:
+        df: Source dataframe
+        column: Column name
+        default: Fill value when the column is missing
+
+    Returns:
+        Array of length len(df)
+    """
+    if column in df.columns:
+        return df[column].to_numpy()
+    return np.full(len(df), default, dtype=object)
+
+
+def _marker_style(feature: Dict) -> Dict:
+    """
+    Style a company HQ GeoJSON point with its precomputed marker color.
+
+    Args:
+        feature: GeoJSON feature with a 'color' property
+
+    Returns:
+        Leaflet path style options
+    """
+    color = feature['properties']['color']
+    return {'color': color, 'fillColor': color, 'fillOpacity': 0.7}
 
 
 def create_us_heat_map(
@@ -278,12 +386,13 @@ def create_us_heat_map(
     """
     # Rename columns to match expected names for validation
     # scored_companies_final.csv uses different column names
-    companies_df = companies_df.copy()
-
-    # Ensure we have required coordinate columns
+    # Ensure we have required coordinate columns (assign copies only when
+    # renaming - the caller's frame is never modified)
     if 'hq_latitude' in companies_df.columns and 'hq_longitude' in companies_df.columns:
-        companies_df['latitude'] = companies_df['hq_latitude']
-        companies_df['longitude'] = companies_df['hq_longitude']
+        companies_df = companies_df.assign(
+            latitude=companies_df['hq_latitude'],
+            longitude=companies_df['hq_longitude']
+        )
 
     # Filter to valid coordinates
     valid_companies, excluded_companies = filter_valid_coordinates(companies_df)
@@ -295,26 +404,25 @@ def create_us_heat_map(
     # Create base map
     m = create_base_map()
 
-    # Add markers for each valid company HQ
-    for _, company in valid_companies.iterrows():
-        # Get company attributes for coloring
-        is_customer = company.get('is_customer', False)
-        has_research = company.get('has_research_doc', False)
-        score = company.get('final_score', 0)
-
-        # Get marker color based on mode
-        color = get_marker_color(
-            is_customer=is_customer,
-            has_research=has_research,
-            score=score,
-            color_mode=color_mode
-        )
-
-        # Format tooltip
-        company_name = company.get('company_name', 'Unknown')
-        city = company.get('city', 'Unknown')
-        state = company.get('state', 'Unknown')
-
+    # Pull the marker inputs out as plain arrays once - iterrows() would box
+    # every row into a Series
+    latitudes = valid_companies['latitude'].to_numpy()
+    longitudes = valid_companies['longitude'].to_numpy()
+    is_customers = _column_values(valid_companies, 'is_customer', False)
+    has_researches = _column_values(valid_companies, 'has_research_doc', False)
+    scores = _column_values(valid_companies, 'final_score', 0)
+    company_names = _column_values(valid_companies, 'company_name', 'Unknown')
+    cities = _column_values(valid_companies, 'city', 'Unknown')
+    states = _column_values(valid_companies, 'state', 'Unknown')
+
+    # Get marker colors based on mode
+    colors = compute_colors(color_mode, is_customers, has_researches, scores)
+
+    # Format tooltips
+    tooltips = []
+    for is_customer, has_research, score, company_name, city, state in zip(
+        is_customers, has_researches, scores, company_names, cities, states
+    ):
         tooltip_text = f"""
         <b>{company_name}</b><br>
         {city}, {state}<br>
@@ -322,17 +430,35 @@ def create_us_heat_map(
         {'✅ Customer' if is_customer else '❌ Prospect'}<br>
         {'📄 Has Research' if has_research else ''}
         """
-
-        # Add marker
-        folium.CircleMarker(
-            location=[company['latitude'], company['longitude']],
-            radius=5,
-            color=color,
-            fill=True,
-            fillColor=color,
-            fillOpacity=0.7,
-            popup=tooltip_text,
-            tooltip=tooltip_text
+        tooltips.append(tooltip_text)
+
+    if len(valid_companies) > FAST_MARKER_THRESHOLD:
+        # Too many markers for per-marker objects - ship one data array and
+        # build the circle markers in the browser, clustered
+        FastMarkerCluster(
+            data=list(zip(latitudes, longitudes, colors.tolist(), tooltips)),
+            callback=FAST_MARKER_CALLBACK,
+            name='Company HQs'
+        ).add_to(m)
+    elif len(valid_companies) > 0:
+        # One GeoJSON layer for all markers - a single template render instead
+        # of a CircleMarker object (and template) per company. Skipped when
+        # empty: the tooltip/popup fields must exist in the data to render
+        features = [
+            {
+                'type': 'Feature',
+                'geometry': {'type': 'Point', 'coordinates': [float(lon), float(lat)]},
+                'properties': {'color': color, 'tooltip': tooltip_text},
+            }
+            for lat, lon, color, tooltip_text in zip(latitudes, longitudes, colors.tolist(), tooltips)
+        ]
+        folium.GeoJson(
+            {'type': 'FeatureCollection', 'features': features},
+            name='Company HQs',
+            marker=folium.CircleMarker(radius=5, fill=True, fill_opacity=0.7),
+            style_function=_marker_style,
+            tooltip=folium.GeoJsonTooltip(fields=['tooltip'], labels=False),
+            popup=folium.GeoJsonPopup(fields=['tooltip'], labels=False)
         ).add_to(m)
 
     # Compile statistics
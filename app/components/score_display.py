@@ -8,11 +8,19 @@ Epic 5 (OWRKS-5.04)
 Spec: §2.2 (Score Display Invariants)
 """
 
+from functools import lru_cache
+import math
+
 import numpy as np
 import pandas as pd
 import streamlit as st
-from typing import Any, Optional
+from typing import Any, Callable, Optional
 
+# PERF NOTE: do not decorate anything in this module with numba @jit/@njit.
+# It is almost entirely string formatting and null dispatch (f-strings,
+# str(int), mixed object inputs), which numba either rejects or runs in
+# object mode, slower than plain Python. Batch work belongs in the
+# vectorized *_series / *_array helpers below.
 
 # Null display map for all nullable fields (Spec: §2.1.1)
 NULL_DISPLAY_MAP = {
@@ -24,6 +32,32 @@ NULL_DISPLAY_MAP = {
     'augmented_score': 'Pending',
 }
 
+# Badge icon per score color (see get_score_color)
+_COLOR_ICON = {
+    'green': '🟢',
+    'yellow': '🟡',
+    'red': '🔴',
+    'gray': '⚪'
+}
+
+
+def is_na(value: Any) -> bool:
+    """
+    Scalar null check without pandas dtype dispatch.
+
+    Covers what row access and to_dict() yield for a missing value: None,
+    pd.NA and NaN floats (including numpy floats). Unlike is_null, empty
+    strings are not treated as missing.
+
+    Args:
+        value: Scalar value
+
+    Returns:
+        True if value is null
+    """
+    # NaN is the only float unequal to itself
+    return value is None or value is pd.NA or (isinstance(value, (float, np.floating)) and value != value)
+
 
 def is_null(value: Any) -> bool:
     """
@@ -37,10 +71,18 @@ def is_null(value: Any) -> bool:
     """
     if value is None:
         return True
-    if isinstance(value, float) and np.isnan(value):
-        return True
-    if isinstance(value, str) and value.strip() == '':
-        return True
+    # Exact-type checks first; NaN is the only float unequal to itself
+    cls = value.__class__
+    if cls is float or cls is np.float64:
+        return not value == value
+    if cls is str:
+        # isspace() scans in place; strip() would allocate a new string
+        return not value or value.isspace()
+    # Subclasses of float/str take the slower isinstance route
+    if isinstance(value, float):
+        return not value == value
+    if isinstance(value, str):
+        return not value or value.isspace()
     return False
 
 
@@ -53,7 +95,8 @@ def format_score(value: Any, max_val: float = 100.0) -> str:
         max_val: Maximum score value (default: 100.0)
 
     Returns:
-        Formatted string (e.g., "78.5") or "N/A" if null
+        Formatted string (e.g., "78.5") or "N/A" if null, non-numeric or
+        non-finite
 
     Spec: §2.2 Score Display Invariants
     """
@@ -63,6 +106,9 @@ def format_score(value: Any, max_val: float = 100.0) -> str:
     try:
         # Convert to float
         score = float(value)
+        # NaN of any float type (or the string "nan") and inf are not scores
+        if not math.isfinite(score):
+            return "N/A"
 
         # Use appropriate precision based on scale
         # For 0-1 scale (e.g., ICP fit score), use 2 decimal places
@@ -83,7 +129,8 @@ def format_percentage(value: Any) -> str:
         value: Percentage value (0-100)
 
     Returns:
-        Formatted string (e.g., "75.5%") or "N/A" if null
+        Formatted string (e.g., "75.5%") or "N/A" if null, non-numeric or
+        non-finite
 
     Spec: §2.2 Score Display Invariants
     """
@@ -92,6 +139,8 @@ def format_percentage(value: Any) -> str:
 
     try:
         percentage = float(value)
+        if not math.isfinite(percentage):
+            return "N/A"
         return f"{percentage:.1f}%"
     except (ValueError, TypeError):
         return "N/A"
@@ -107,7 +156,8 @@ def format_confidence(value: Any) -> str:
         value: Confidence value (0-1)
 
     Returns:
-        Formatted string (e.g., "85%") or "N/A" if null
+        Formatted string (e.g., "85%") or "N/A" if null, non-numeric or
+        non-finite
 
     Spec: §2.2 Score Display Invariants
     """
@@ -115,14 +165,101 @@ def format_confidence(value: Any) -> str:
         return "N/A"
 
     try:
-        confidence = float(value)
-        percentage = confidence * 100
+        # Checked after scaling so values that overflow to inf also print N/A
+        percentage = float(value) * 100
+        if not math.isfinite(percentage):
+            return "N/A"
         # Round to nearest integer for confidence display
         return f"{int(round(percentage))}%"
     except (ValueError, TypeError):
         return "N/A"
 
 
+def _to_float_array(values: Any) -> np.ndarray:
+    """
+    Coerce a column of score-like values to float64, NaN for anything unusable.
+
+    Blank strings, None, NaN and unparseable values all become NaN; together
+    with inf, an isfinite mask covers every case the scalar formatters
+    treat as "N/A".
+
+    Args:
+        values: Series, array or list of raw values
+
+    Returns:
+        float64 NumPy array
+    """
+    series = values if isinstance(values, pd.Series) else pd.Series(values, dtype=object)
+    return pd.to_numeric(series, errors='coerce').to_numpy(dtype='float64', na_value=np.nan)
+
+
+def _series_like(values: Any, formatted: np.ndarray) -> pd.Series:
+    """Wrap formatted strings in a Series aligned with the input's index."""
+    index = values.index if isinstance(values, pd.Series) else None
+    return pd.Series(formatted, index=index, dtype=object)
+
+
+def format_score_series(values: Any, max_val: float = 100.0) -> pd.Series:
+    """
+    Vectorized format_score for a whole column of scores.
+
+    Args:
+        values: Series/array of score values (0-max_val)
+        max_val: Maximum score value (default: 100.0)
+
+    Returns:
+        Series of formatted strings, "N/A" where null, non-numeric or
+        non-finite
+
+    Spec: §2.2 Score Display Invariants
+    """
+    arr = _to_float_array(values)
+    fmt = '%.2f' if max_val <= 1.0 else '%.1f'
+    formatted = np.where(np.isfinite(arr), np.char.mod(fmt, arr), 'N/A')
+    return _series_like(values, formatted)
+
+
+def format_percentage_series(values: Any) -> pd.Series:
+    """
+    Vectorized format_percentage for a whole column.
+
+    Args:
+        values: Series/array of percentage values (0-100)
+
+    Returns:
+        Series of formatted strings (e.g., "75.5%"), "N/A" where null,
+        non-numeric or non-finite
+
+    Spec: §2.2 Score Display Invariants
+    """
+    arr = _to_float_array(values)
+    formatted = np.where(np.isfinite(arr), np.char.mod('%.1f%%', arr), 'N/A')
+    return _series_like(values, formatted)
+
+
+def format_confidence_series(values: Any) -> pd.Series:
+    """
+    Vectorized format_confidence for a whole column of 0-1 confidences.
+
+    Args:
+        values: Series/array of confidence values (0-1)
+
+    Returns:
+        Series of formatted strings (e.g., "85%"), "N/A" where null,
+        non-numeric or non-finite
+
+    Spec: §2.2 Score Display Invariants
+    """
+    arr = _to_float_array(values)
+    # np.rint rounds half to even, matching the scalar path's round(); adding
+    # 0.0 turns the -0.0 it returns for small negatives into 0.0 ("0%", as
+    # int() gives on the scalar path, not "-0%")
+    with np.errstate(invalid='ignore', over='ignore'):
+        percentages = np.rint(arr * 100) + 0.0
+    formatted = np.where(np.isfinite(percentages), np.char.mod('%.0f%%', percentages), 'N/A')
+    return _series_like(values, formatted)
+
+
 def get_score_color(score: Any) -> str:
     """
     Get color code for score badge.
@@ -150,6 +287,54 @@ def get_score_color(score: Any) -> str:
         return "gray"
 
 
+# Bucket edges and colors for get_score_color_array (red < 40 <= yellow < 70 <= green)
+_SCORE_COLOR_BINS = np.array([40.0, 70.0])
+_SCORE_COLORS = np.array(['red', 'yellow', 'green'], dtype=object)
+
+
+def get_score_color_array(scores: Any) -> np.ndarray:
+    """
+    Vectorized get_score_color for many scores at once.
+
+    Args:
+        scores: Series/array/list of score values (0-100)
+
+    Returns:
+        Object array of color strings, "gray" where null or non-numeric
+
+    Spec: §2.2 Score Display Invariants
+    """
+    arr = _to_float_array(scores)
+    colors = _SCORE_COLORS[np.digitize(arr, _SCORE_COLOR_BINS)]
+    colors[np.isnan(arr)] = 'gray'
+    return colors
+
+
+@lru_cache(maxsize=256)
+def _display_name(name: str) -> str:
+    """
+    Turn a snake_case key into a title-cased label (e.g. "icp_fit" -> "Icp Fit").
+
+    Memoized - component names and ICP bases come from a small fixed vocabulary.
+    """
+    return name.replace('_', ' ').title()
+
+
+def _make_nullable_formatter(placeholder: str) -> Callable[[Any], str]:
+    """Build a formatter that returns placeholder for nulls, str(value) otherwise."""
+    def _format(value: Any) -> str:
+        return placeholder if is_null(value) else str(value)
+    return _format
+
+
+# Per-field formatters built once from NULL_DISPLAY_MAP; unknown fields use 'N/A'
+_NULLABLE_FORMATTERS = {
+    field: _make_nullable_formatter(placeholder)
+    for field, placeholder in NULL_DISPLAY_MAP.items()
+}
+_DEFAULT_NULLABLE_FORMATTER = _make_nullable_formatter('N/A')
+
+
 def format_nullable_field(value: Any, field_name: str) -> str:
     """
     Format a nullable field using NULL_DISPLAY_MAP.
@@ -163,15 +348,8 @@ def format_nullable_field(value: Any, field_name: str) -> str:
 
     Spec: §2.1.1 Null handling requirements
     """
-    # Check for empty string specifically for contact_notes
-    if field_name == 'contact_notes' and isinstance(value, str) and value.strip() == '':
-        return NULL_DISPLAY_MAP.get(field_name, 'N/A')
-
-    if is_null(value):
-        return NULL_DISPLAY_MAP.get(field_name, 'N/A')
-
-    # Return value as string
-    return str(value)
+    # is_null already treats blank strings (e.g. empty contact_notes) as null
+    return _NULLABLE_FORMATTERS.get(field_name, _DEFAULT_NULLABLE_FORMATTER)(value)
 
 
 def render_score_badge(score: Any, label: str, key: Optional[str] = None) -> None:
@@ -191,21 +369,28 @@ def render_score_badge(score: Any, label: str, key: Optional[str] = None) -> Non
 
     Spec: §2.2 Score Display Invariants
     """
-    color = get_score_color(score)
-    formatted_score = format_score(score)
+    # Display badge
+    st.markdown(_compose_badge_md(score, label))
+
 
-    # Color mapping for Streamlit
-    color_map = {
-        'green': '🟢',
-        'yellow': '🟡',
-        'red': '🔴',
-        'gray': '⚪'
-    }
+@lru_cache(maxsize=1024)
+def _compose_badge_md(score: Any, label: str) -> str:
+    """
+    Build the badge markdown for a score and label.
 
-    icon = color_map.get(color, '⚪')
+    Memoized in-process so reruns with unchanged scores skip the formatters.
+    (st.cache_data would hash and pickle the arguments on every call, which
+    costs ~100x more than the formatting it saves.)
 
-    # Display badge
-    st.markdown(f"{icon} **{label}:** {formatted_score}")
+    Args:
+        score: Score value (0-100); must be hashable
+        label: Label for the badge
+
+    Returns:
+        Markdown string like "🟢 **Final Score:** 78.5"
+    """
+    icon = _COLOR_ICON.get(get_score_color(score), '⚪')
+    return f"{icon} **{label}:** {format_score(score)}"
 
 
 def render_score_comparison(
@@ -227,22 +412,36 @@ def render_score_comparison(
 
     Spec: §2.2 Score Display Invariants
     """
-    col1, col2 = st.columns(2)
-
-    with col1:
-        st.metric(label_standard, format_score(standard))
-
-    with col2:
-        # Calculate delta if both scores are valid
-        delta = None
-        if not is_null(standard) and not is_null(augmented):
-            try:
-                delta_val = float(augmented) - float(standard)
-                delta = f"{delta_val:+.1f}"
-            except (ValueError, TypeError):
-                pass
+    # Calculate delta if both scores are valid
+    delta_html = ""
+    if not is_null(standard) and not is_null(augmented):
+        try:
+            delta_val = float(augmented) - float(standard)
+            delta = f"{delta_val:+.1f}"
+            # Same arrow/color convention as st.metric deltas
+            if delta.startswith('-'):
+                delta_html = f'<div style="color:#ff4b4b;font-size:0.875rem">↓ {delta}</div>'
+            else:
+                delta_html = f'<div style="color:#21c354;font-size:0.875rem">↑ {delta}</div>'
+        except (ValueError, TypeError):
+            pass
+
+    # Both scores in one flex row - a single element instead of
+    # st.columns(2) plus two st.metric widgets
+    html = f"""
+    <div style="display:flex;gap:2rem">
+        <div style="flex:1">
+            <div style="font-size:0.875rem">{label_standard}</div>
+            <div style="font-size:2.25rem;line-height:1.2">{format_score(standard)}</div>
+        </div>
+        <div style="flex:1">
+            <div style="font-size:0.875rem">{label_augmented}</div>
+            <div style="font-size:2.25rem;line-height:1.2">{format_score(augmented)}</div>{delta_html}
+        </div>
+    </div>
+    """
 
-        st.metric(label_augmented, format_score(augmented), delta=delta)
+    st.markdown(html, unsafe_allow_html=True)
 
 
 def format_score_with_confidence(score: Any, confidence: Any) -> str:
@@ -256,16 +455,22 @@ def format_score_with_confidence(score: Any, confidence: Any) -> str:
     Returns:
         Formatted string like "85.5 (90% confidence)"
     """
-    score_str = format_score(score)
-    confidence_str = format_confidence(confidence)
-
-    if score_str == "N/A":
+    # Null-check and coerce each value once instead of via format_score/format_confidence
+    if is_null(score):
+        return "N/A"
+    try:
+        score_str = f"{float(score):.1f}"
+    except (ValueError, TypeError):
         return "N/A"
 
-    if confidence_str == "N/A":
+    if is_null(confidence):
+        return score_str
+    try:
+        confidence_val = float(confidence)
+    except (ValueError, TypeError):
         return score_str
 
-    return f"{score_str} ({confidence_str} confidence)"
+    return f"{score_str} ({int(round(confidence_val * 100))}% confidence)"
 
 
 def render_score_breakdown(
@@ -285,23 +490,30 @@ def render_score_breakdown(
     """
     st.subheader(title)
 
-    for component_name, score in component_scores.items():
-        color = get_score_color(score)
-        formatted_score = format_score(score)
+    # Classify and format all component scores in one pass before rendering
+    scores = list(component_scores.values())
+    colors = get_score_color_array(scores)
+    formatted_scores = format_score_series(scores)
 
-        # Display component with color badge
-        color_map = {
-            'green': '🟢',
-            'yellow': '🟡',
-            'red': '🔴',
-            'gray': '⚪'
-        }
-        icon = color_map.get(color, '⚪')
+    lines = []
+    for component_name, color, formatted_score in zip(component_scores, colors, formatted_scores):
+        icon = _COLOR_ICON.get(color, '⚪')
 
         # Format component name nicely
-        display_name = component_name.replace('_', ' ').title()
+        display_name = _display_name(component_name)
+
+        lines.append(f"{icon} **{display_name}:** {formatted_score}")
 
-        st.markdown(f"{icon} **{display_name}:** {formatted_score}")
+    # One markdown element for the whole breakdown; trailing double space is a line break
+    if lines:
+        st.markdown("  \n".join(lines))
+
+
+# Null ICP fit display per basis; any other basis shows plain "N/A"
+_ICP_NULL_DISPLAY = {
+    'no_data': "N/A (no data)",
+    'partial': "N/A (partial data)",
+}
 
 
 def format_icp_fit_score(score: Any, basis: str = None) -> str:
@@ -316,19 +528,14 @@ def format_icp_fit_score(score: Any, basis: str = None) -> str:
         Formatted string like "0.85 (calculated)" or "N/A (no data)"
     """
     if is_null(score):
-        if basis == 'no_data':
-            return "N/A (no data)"
-        elif basis == 'partial':
-            return "N/A (partial data)"
-        else:
-            return "N/A"
+        return _ICP_NULL_DISPLAY.get(basis, "N/A")
 
     try:
         score_val = float(score)
         score_str = f"{score_val:.2f}"
 
         if basis:
-            basis_display = basis.replace('_', ' ').title()
+            basis_display = _display_name(basis)
             return f"{score_str} ({basis_display})"
         else:
             return score_str
@@ -352,10 +559,14 @@ def format_large_number(value: Any, field_name: str = None) -> str:
             return NULL_DISPLAY_MAP.get(field_name, 'N/A')
         return "N/A"
 
+    # Plain ints (the usual case for employee counts) need no float round-trip
+    if value.__class__ is int:
+        return f"{value:,}"
+
     try:
         num = float(value)
         # Format with thousand separators, no decimal places for large numbers
-        if num == int(num):
+        if num.is_integer():
             return f"{int(num):,}"
         else:
             return f"{num:,.1f}"
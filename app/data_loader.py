@@ -8,16 +8,25 @@ Epic 5 (OWRKS-5.02)
 Spec: §1.1-1.7 (Preconditions), §4.3 (Caching)
 """
 
+import hashlib
 import json
 import logging
 import os
+import uuid
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple, Union
 
+import numpy as np
 import pandas as pd
 import streamlit as st
 import yaml
 
+try:
+    import orjson  # Optional - faster JSON parsing for research files
+except ImportError:
+    orjson = None
+
 from app.exceptions import DataLoadError, SchemaValidationError
 
 logger = logging.getLogger(__name__)
@@ -25,11 +34,27 @@ logger = logging.getLogger(__name__)
 # Cache TTL: 300 seconds (5 minutes)
 CACHE_TTL = 300
 
+# libyaml's C parser when PyYAML was built with it, pure-Python SafeLoader otherwise
+YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+# Index names for frames keyed by company_id (see index_by_company_id and
+# index_by_normalized_company_id)
+COMPANY_ID_INDEX = '_cid'
+COMPANY_ID_NORM_INDEX = '_cid_norm'
+
+# DataFrame.attrs key holding a token that changes every time a loader
+# actually re-reads its data (cache hits share the token - see stamp_load_version)
+LOAD_VERSION_ATTR = 'load_version'
+
 
+@lru_cache(maxsize=1)
 def get_data_dir() -> Path:
     """
     Get data directory from environment variable or default.
 
+    Resolved once per process (every loader calls this); clear_cache()
+    resets it so a changed OPENWORKS_DATA_DIR is picked up on refresh.
+
     Returns:
         Path to data directory
 
@@ -68,7 +93,7 @@ def load_exclusions_config() -> Dict[str, Any]:
 
     try:
         with open(file_path) as f:
-            config = yaml.safe_load(f)
+            config = yaml.load(f, Loader=YAML_LOADER)
     except yaml.YAMLError as e:
         raise DataLoadError(f"Invalid YAML in {file_path}: {e}")
     except Exception as e:
@@ -108,6 +133,207 @@ def _get_excluded_naics_codes() -> List[str]:
     return excluded_codes
 
 
+def stamp_load_version(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Tag a freshly loaded frame with a new load-version token.
+
+    The token lives in df.attrs, which st.cache_data pickles along with the
+    frame - every cache hit returns a copy carrying the same token, and a
+    reload (TTL expiry or clear_cache) produces a new one. Per-session caches
+    keyed on the token therefore never outlive the data they were built from.
+
+    Args:
+        df: Loaded DataFrame (modified in place)
+
+    Returns:
+        The same DataFrame
+    """
+    df.attrs[LOAD_VERSION_ATTR] = uuid.uuid4().hex
+    return df
+
+
+def _restore_string_nans(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Turn None back into NaN in object columns (Parquet reads nulls as None).
+
+    Args:
+        df: DataFrame read from Parquet (modified in place)
+
+    Returns:
+        The same DataFrame
+    """
+    for col in df.columns[df.dtypes == object]:
+        missing = df[col].isna()
+        if missing.any():
+            df.loc[missing, col] = np.nan
+    return df
+
+
+def _read_csv_cached(file_path: Path, **csv_kwargs) -> pd.DataFrame:
+    """
+    Read a CSV through a Parquet sidecar that is rebuilt whenever the CSV changes.
+
+    The sidecar sits next to the CSV, named after a hash of the read_csv
+    arguments (reads with different dtypes don't share it), and carries the
+    CSV's mtime so any replacement of the CSV invalidates it. If the sidecar
+    can't be read or written (e.g. read-only data dir) the CSV is parsed as usual.
+
+    Args:
+        file_path: Path to CSV file
+        **csv_kwargs: Keyword arguments for pd.read_csv
+
+    Returns:
+        DataFrame equal to pd.read_csv(file_path, **csv_kwargs)
+    """
+    kwargs_key = hashlib.md5(repr(sorted(csv_kwargs.items())).encode()).hexdigest()[:8]
+    sidecar = file_path.with_name(f"{file_path.stem}.{kwargs_key}.parquet")
+    csv_stat = file_path.stat()
+
+    try:
+        if sidecar.stat().st_mtime_ns == csv_stat.st_mtime_ns:
+            return _restore_string_nans(pd.read_parquet(sidecar))
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        logger.debug(f"Ignoring unreadable Parquet cache {sidecar}: {e}")
+
+    df = pd.read_csv(file_path, **csv_kwargs)
+
+    # Write to a temp file and rename so concurrent readers never see a partial file
+    tmp_path = sidecar.with_name(f"{sidecar.name}.{os.getpid()}.tmp")
+    try:
+        df.to_parquet(tmp_path)
+        os.utime(tmp_path, ns=(csv_stat.st_atime_ns, csv_stat.st_mtime_ns))
+        os.replace(tmp_path, sidecar)
+    except Exception as e:
+        logger.debug(f"Could not write Parquet cache {sidecar}: {e}")
+        tmp_path.unlink(missing_ok=True)
+
+    return df
+
+
+def parse_json(data: Union[str, bytes]) -> Any:
+    """
+    Parse a JSON document, using orjson when it is installed.
+
+    orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers only
+    need to catch the stdlib exception.
+
+    Args:
+        data: JSON text (str or UTF-8 bytes)
+
+    Returns:
+        Parsed JSON data
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+
+    return json.loads(data)
+
+
+def _read_json(file_path: Path) -> Any:
+    """
+    Parse a JSON file, using orjson when it is installed.
+
+    Args:
+        file_path: Path to JSON file
+
+    Returns:
+        Parsed JSON data
+    """
+    with open(file_path, 'rb') as f:
+        return parse_json(f.read())
+
+
+def index_by_company_id(df: pd.DataFrame, key: str = 'company_id') -> pd.DataFrame:
+    """
+    Index a DataFrame by the string form of its company_id column.
+
+    The company_id column is kept, so merges and filters on it still work.
+    Frames that already carry this index are returned unchanged, which lets
+    the cached loaders pay for the cast and hash table once per load.
+
+    Args:
+        df: DataFrame with a company_id column
+        key: Name of the company_id column
+
+    Returns:
+        DataFrame indexed by string company_id (duplicates preserved in order)
+    """
+    if df.index.name == COMPANY_ID_INDEX:
+        return df
+
+    return df.set_index(df[key].astype(str).rename(COMPANY_ID_INDEX))
+
+
+def _categorize_company_ids(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Store company_id as a category so equality and isin compare int codes.
+
+    Args:
+        df: DataFrame with a company_id column (modified in place)
+
+    Returns:
+        The same DataFrame
+    """
+    df['company_id'] = df['company_id'].astype('category')
+    return df
+
+
+def normalize_company_ids(company_ids: pd.Series) -> pd.Series:
+    """
+    Convert company IDs to integers, dropping zero-padding.
+
+    Both '7526346' and '007526346' normalize to 7526346. Non-numeric IDs
+    become <NA>.
+
+    Args:
+        company_ids: Series of company IDs
+
+    Returns:
+        Nullable Int64 series of normalized company IDs
+    """
+    return pd.to_numeric(company_ids.astype(str), errors='coerce').astype('Int64')
+
+
+def normalize_company_id(company_id: str) -> Optional[int]:
+    """
+    Convert a single company ID to its normalized integer form.
+
+    Args:
+        company_id: Company ID (possibly zero-padded)
+
+    Returns:
+        Integer company ID or None if not numeric
+    """
+    try:
+        return int(str(company_id).lstrip('0') or '0')  # Keep 0 if all zeros
+    except ValueError:
+        return None
+
+
+def index_by_normalized_company_id(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Index a buildings DataFrame by its integer-normalized company_id.
+
+    Adds a 'company_id_i64' column if missing. Frames that already carry
+    this index are returned unchanged.
+
+    Args:
+        df: DataFrame with a company_id column
+
+    Returns:
+        DataFrame indexed by normalized company_id
+    """
+    if df.index.name == COMPANY_ID_NORM_INDEX:
+        return df
+
+    if 'company_id_i64' not in df.columns:
+        df = df.assign(company_id_i64=normalize_company_ids(df['company_id']))
+
+    return df.set_index(df['company_id_i64'].rename(COMPANY_ID_NORM_INDEX))
+
+
 def validate_schema(df: pd.DataFrame, required_columns: List[str], file_name: str) -> None:
     """
     Validate that DataFrame contains all required columns.
@@ -155,7 +381,7 @@ def load_companies() -> pd.DataFrame:
         )
 
     try:
-        df = pd.read_csv(file_path, dtype=str)
+        df = _read_csv_cached(file_path, dtype=str)
     except Exception as e:
         raise DataLoadError(f"Failed to read {file_path}: {e}")
 
@@ -172,8 +398,11 @@ def load_companies() -> pd.DataFrame:
     if 'building_count_estimate' in df.columns and 'building_count' not in df.columns:
         df['building_count'] = df['building_count_estimate']
 
+    # Index by company_id once so detail lookups are hash probes, not scans
+    df = _categorize_company_ids(index_by_company_id(df))
+
     logger.info(f"Loaded {len(df)} companies from {file_path}")
-    return df
+    return stamp_load_version(df)
 
 
 @st.cache_data(ttl=CACHE_TTL)
@@ -202,7 +431,7 @@ def load_buildings() -> pd.DataFrame:
     if golden_path.exists():
         # Use golden buildings which includes HubSpot (served) buildings
         try:
-            df = pd.read_csv(golden_path, dtype={'company_id': str, 'building_id': str})
+            df = _read_csv_cached(golden_path, dtype={'company_id': str, 'building_id': str})
             logger.info(f"Loaded {len(df)} buildings from golden_buildings.csv (includes served buildings)")
             file_path = golden_path  # For error messages
         except Exception as e:
@@ -211,7 +440,7 @@ def load_buildings() -> pd.DataFrame:
         # Fallback to buildings.csv (Epic 1 output, no served buildings)
         logger.warning("golden_buildings.csv not found, using buildings.csv (no served buildings)")
         try:
-            df = pd.read_csv(file_path, dtype={'company_id': str, 'building_id': str})
+            df = _read_csv_cached(file_path, dtype={'company_id': str, 'building_id': str})
         except Exception as e:
             raise DataLoadError(f"Failed to read {file_path}: {e}")
     else:
@@ -233,15 +462,14 @@ def load_buildings() -> pd.DataFrame:
         logger.warning("No source column, defaulting all buildings to dataaxle (unserved)")
         df['source'] = 'dataaxle'
 
-    # Fill any null sources
-    df['source'] = df['source'].fillna('dataaxle')
+    # Fill any null sources - skip the column rewrite when upstream left none
+    if df['source'].isna().any():
+        df['source'] = df['source'].fillna('dataaxle')
 
     # Add is_served column based on source
     if 'is_served' not in df.columns:
         # Derive is_served from source: manual/hubspot = served, dataaxle = not served
-        df['is_served'] = df['source'].apply(
-            lambda x: x.lower() in ['manual', 'hubspot'] if pd.notna(x) else False
-        )
+        df['is_served'] = df['source'].str.lower().isin(['manual', 'hubspot'])
         logger.info(f"Derived is_served: {df['is_served'].sum()} served, {(~df['is_served']).sum()} unserved")
 
     if 'square_footage' not in df.columns:
@@ -263,8 +491,11 @@ def load_buildings() -> pd.DataFrame:
             f"This indicates an upstream data issue - check Epic 1 and Epic 2 pipelines."
         )
 
+    # Normalize company_id once so per-company lookups skip the string pass
+    df = _categorize_company_ids(index_by_normalized_company_id(df))
+
     logger.info(f"Loaded {len(df)} buildings from {file_path}")
-    return df
+    return stamp_load_version(df)
 
 
 @st.cache_data(ttl=CACHE_TTL)
@@ -300,7 +531,7 @@ def load_scored_companies() -> pd.DataFrame:
 
     try:
         # Read with company_id as string to preserve leading zeros and ensure join integrity
-        df = pd.read_csv(file_path, dtype={'company_id': str})
+        df = _read_csv_cached(file_path, dtype={'company_id': str})
     except Exception as e:
         raise DataLoadError(f"Failed to read {file_path}: {e}")
 
@@ -331,11 +562,24 @@ def load_scored_companies() -> pd.DataFrame:
 
     validate_schema(df, required_columns, file_path.name)
 
-    # Filter out company_ids that don't exist in companies.csv
-    # This makes the UI resilient to upstream data issues
-    initial_count = len(df)
-    df = _filter_orphaned_companies(df)
-    filtered_count = initial_count - len(df)
+    # Filter out company_ids that don't exist in companies.csv (resilience to
+    # upstream data issues) and apply industry exclusions (e.g., public
+    # education) - both masks are combined and the frame is sliced once
+    orphaned_mask = _orphaned_companies_mask(df)
+    excluded_mask = _excluded_industries_mask(df)
+
+    keep_mask = pd.Series(True, index=df.index)
+    filtered_count = excluded_count = 0
+    if orphaned_mask is not None:
+        keep_mask &= ~orphaned_mask
+        filtered_count = int(orphaned_mask.sum())
+    if excluded_mask is not None:
+        # Count exclusions among non-orphans, as if applied after the orphan filter
+        excluded_count = int((excluded_mask & keep_mask).sum())
+        keep_mask &= ~excluded_mask
+
+    if filtered_count or excluded_count:
+        df = df[keep_mask]
 
     if filtered_count > 0:
         logger.warning(
@@ -343,11 +587,6 @@ def load_scored_companies() -> pd.DataFrame:
             f"This indicates an upstream data issue - check Epic 1 and Epic 4 pipelines."
         )
 
-    # Apply industry exclusions (e.g., public education)
-    initial_count = len(df)
-    df = _apply_industry_exclusions(df)
-    excluded_count = initial_count - len(df)
-
     if excluded_count > 0:
         logger.info(
             f"Excluded {excluded_count} companies based on industry exclusions config "
@@ -361,8 +600,56 @@ def load_scored_companies() -> pd.DataFrame:
     # Merge building_count from companies.csv (needed for UI display)
     df = _merge_building_count(df)
 
+    # Index by company_id once so detail lookups are hash probes, not scans
+    df = _categorize_company_ids(index_by_company_id(df))
+
+    # Two-valued label (Prospect / Customer Expansion) - compare int codes, not strings
+    if 'scoring_path' in df.columns:
+        df['scoring_path'] = df['scoring_path'].astype('category')
+
     logger.info(f"Loaded {len(df)} scored companies from {file_path}")
-    return df
+    return stamp_load_version(df)
+
+
+@st.cache_data(ttl=CACHE_TTL)
+def _load_company_id_index() -> Optional[Tuple[Optional[pd.Index], Optional[Dict[str, Any]]]]:
+    """
+    Read companies.csv once for the orphan filters and the building_count merge.
+
+    Returns:
+        None if companies.csv doesn't exist, otherwise (valid_ids, building_counts):
+        - valid_ids: unique Index of company_id strings (None if the column
+          is missing) - isin() probes it directly instead of rehashing a
+          Python set
+        - building_counts: dict mapping company_id to building_count (None
+          if that column is missing; first row wins for duplicate IDs)
+
+    Raises:
+        Exception: Any error reading companies.csv (callers log and degrade)
+    """
+    data_dir = get_data_dir()
+    companies_path = data_dir / "processed" / "companies.csv"
+
+    if not companies_path.exists():
+        return None
+
+    # Parse only the two columns needed here (header read first, since
+    # building_count is optional and usecols rejects missing names)
+    header = pd.read_csv(companies_path, nrows=0).columns
+    usecols = [col for col in ('company_id', 'building_count') if col in header]
+    if 'company_id' not in usecols:
+        return None, None
+
+    companies_df = _read_csv_cached(companies_path, usecols=usecols, dtype=str)
+
+    valid_ids = pd.Index(companies_df['company_id'].unique())
+
+    building_counts = None
+    if 'building_count' in companies_df.columns:
+        counts = companies_df.drop_duplicates('company_id').set_index('company_id')['building_count']
+        building_counts = pd.to_numeric(counts).to_dict()
+
+    return valid_ids, building_counts
 
 
 def _merge_building_count(scored_df: pd.DataFrame) -> pd.DataFrame:
@@ -375,36 +662,27 @@ def _merge_building_count(scored_df: pd.DataFrame) -> pd.DataFrame:
     Returns:
         DataFrame with building_count column added
     """
-    # Load companies.csv to get building_count
-    data_dir = get_data_dir()
-    companies_path = data_dir / "processed" / "companies.csv"
-
-    if not companies_path.exists():
-        logger.warning("companies.csv not found - cannot add building_count")
-        scored_df['building_count'] = None
-        return scored_df
-
+    # building_count comes from companies.csv (shared cached read)
     try:
-        companies_df = pd.read_csv(companies_path, dtype={'company_id': str})
+        company_index = _load_company_id_index()
     except Exception as e:
         logger.warning(f"Failed to read companies.csv for building_count: {e}")
         scored_df['building_count'] = None
         return scored_df
 
-    if 'building_count' not in companies_df.columns:
-        logger.warning("companies.csv missing building_count column")
+    if company_index is None:
+        logger.warning("companies.csv not found - cannot add building_count")
         scored_df['building_count'] = None
         return scored_df
 
-    # Merge building_count
-    scored_df = scored_df.merge(
-        companies_df[['company_id', 'building_count']],
-        on='company_id',
-        how='left'
-    )
+    _, building_counts = company_index
+    if building_counts is None:
+        logger.warning("companies.csv missing building_count column")
+        scored_df['building_count'] = None
+        return scored_df
 
-    # Fill any missing values with 0
-    scored_df['building_count'] = scored_df['building_count'].fillna(0).astype(int)
+    # Look up building_count per company; fill any missing values with 0
+    scored_df['building_count'] = scored_df['company_id'].map(building_counts).fillna(0).astype(int)
 
     return scored_df
 
@@ -436,16 +714,11 @@ def _rerank_within_segments(scored_df: pd.DataFrame) -> pd.DataFrame:
     scored_df = scored_df.sort_values(
         ['primary_naics', score_col, rank_col],
         ascending=[True, False, True]
-    ).copy()
-
-    # Re-assign rank within each NAICS group
-    def assign_contiguous_rank(group):
-        """Assign contiguous ranks 1, 2, 3, ... within a group."""
-        group = group.copy()
-        group[rank_col] = range(1, len(group) + 1)
-        return group
+    )
 
-    scored_df = scored_df.groupby('primary_naics', group_keys=False).apply(assign_contiguous_rank, include_groups=True)
+    # Re-assign contiguous ranks 1, 2, 3, ... within each NAICS group
+    # (rows are already in group/score order, so position within group is the rank)
+    scored_df[rank_col] = scored_df.groupby('primary_naics', sort=False, dropna=False).cumcount() + 1
 
     # Sort the DataFrame by NAICS and rank to ensure row order matches rank order
     # This is critical for UI validation which expects ranks to match score order in the DataFrame
@@ -469,27 +742,23 @@ def _filter_orphaned_buildings(buildings_df: pd.DataFrame) -> pd.DataFrame:
     Returns:
         Filtered DataFrame with only buildings for valid company_ids
     """
-    # Load companies.csv to get valid company_ids
-    data_dir = get_data_dir()
-    companies_path = data_dir / "processed" / "companies.csv"
-
-    if not companies_path.exists():
-        # If companies.csv doesn't exist, return buildings_df as-is
-        # The main data loader will catch this later
-        return buildings_df
-
+    # Valid company_ids come from companies.csv (shared cached read)
     try:
-        companies_df = pd.read_csv(companies_path, dtype=str)
+        company_index = _load_company_id_index()
     except Exception as e:
         logger.warning(f"Failed to read companies.csv for filtering buildings: {e}")
         return buildings_df
 
-    if 'company_id' not in companies_df.columns:
+    if company_index is None:
+        # If companies.csv doesn't exist, return buildings_df as-is
+        # The main data loader will catch this later
+        return buildings_df
+
+    valid_ids, _ = company_index
+    if valid_ids is None:
         logger.warning("companies.csv missing company_id column - cannot filter buildings")
         return buildings_df
 
-    # Get valid company_ids (already strings from load_companies)
-    valid_ids = set(companies_df['company_id'])
     building_company_ids = buildings_df['company_id']
 
     # Identify orphaned buildings
@@ -504,15 +773,15 @@ def _filter_orphaned_buildings(buildings_df: pd.DataFrame) -> pd.DataFrame:
         )
 
         # Filter to only buildings for valid companies
-        filtered_df = buildings_df[~orphaned_mask].copy()
+        filtered_df = buildings_df[~orphaned_mask]
         return filtered_df
 
     return buildings_df
 
 
-def _apply_industry_exclusions(scored_df: pd.DataFrame) -> pd.DataFrame:
+def _excluded_industries_mask(scored_df: pd.DataFrame) -> Optional[pd.Series]:
     """
-    Filter out companies based on industry exclusions configuration.
+    Flag companies excluded by the industry exclusions configuration.
 
     Applies exclusions defined in data/config/exclusions.yaml based on primary_naics codes.
     This allows filtering out unwanted industries (e.g., public education) from the UI
@@ -522,70 +791,68 @@ def _apply_industry_exclusions(scored_df: pd.DataFrame) -> pd.DataFrame:
         scored_df: Scored companies DataFrame
 
     Returns:
-        Filtered DataFrame with excluded industries removed
+        Boolean Series, True for companies to exclude, or None if no
+        exclusions apply
     """
     if len(scored_df) == 0:
-        return scored_df
+        return None
 
     # Get list of NAICS codes to exclude (as strings from YAML)
     excluded_codes_str = _get_excluded_naics_codes()
 
     if not excluded_codes_str:
         # No exclusions configured
-        return scored_df
+        return None
 
-    # Convert excluded codes to integers for comparison
-    # (primary_naics column is stored as int64 in the CSV)
-    excluded_codes = [int(code) for code in excluded_codes_str]
+    # Match the codes to the column's dtype once: primary_naics is normally
+    # int64 in the CSV, but compare as strings if it was read as text
+    if pd.api.types.is_numeric_dtype(scored_df['primary_naics']):
+        excluded_codes = frozenset(int(code) for code in excluded_codes_str)
+    else:
+        excluded_codes = frozenset(str(code) for code in excluded_codes_str)
 
-    # Filter out companies with excluded NAICS codes
-    initial_count = len(scored_df)
-    mask = ~scored_df['primary_naics'].isin(excluded_codes)
-    filtered_df = scored_df[mask].copy()
+    # Flag companies with excluded NAICS codes
+    excluded_mask = scored_df['primary_naics'].isin(excluded_codes)
 
-    excluded_count = initial_count - len(filtered_df)
-    if excluded_count > 0:
+    if logger.isEnabledFor(logging.DEBUG) and excluded_mask.any():
         # Log sample of excluded companies for debugging
-        excluded_sample = scored_df[~mask][['company_name', 'primary_naics']].head(5)
+        excluded_sample = scored_df[excluded_mask][['company_name', 'primary_naics']].head(5)
         logger.debug(
-            f"Excluded {excluded_count} companies with NAICS codes {excluded_codes}. "
+            f"Excluding {int(excluded_mask.sum())} companies with NAICS codes {sorted(excluded_codes)}. "
             f"Sample: {excluded_sample.to_dict('records')}"
         )
 
-    return filtered_df
+    return excluded_mask
 
 
-def _filter_orphaned_companies(scored_df: pd.DataFrame) -> pd.DataFrame:
+def _orphaned_companies_mask(scored_df: pd.DataFrame) -> Optional[pd.Series]:
     """
-    Filter scored companies to only include those that exist in companies.csv.
+    Flag scored companies that don't exist in companies.csv.
 
     Args:
         scored_df: Scored companies DataFrame
 
     Returns:
-        Filtered DataFrame with only valid company_ids
+        Boolean Series, True for orphaned company_ids, or None if
+        companies.csv can't be used for filtering
     """
-    # Load companies.csv to get valid company_ids
-    data_dir = get_data_dir()
-    companies_path = data_dir / "processed" / "companies.csv"
-
-    if not companies_path.exists():
-        # If companies.csv doesn't exist, return scored_df as-is
-        # The main data loader will catch this later
-        return scored_df
-
+    # Valid company_ids come from companies.csv (shared cached read)
     try:
-        companies_df = pd.read_csv(companies_path, dtype=str)
+        company_index = _load_company_id_index()
     except Exception as e:
         logger.warning(f"Failed to read companies.csv for filtering: {e}")
-        return scored_df
+        return None
 
-    if 'company_id' not in companies_df.columns:
+    if company_index is None:
+        # If companies.csv doesn't exist, skip filtering
+        # The main data loader will catch this later
+        return None
+
+    valid_ids, _ = company_index
+    if valid_ids is None:
         logger.warning("companies.csv missing company_id column - cannot filter")
-        return scored_df
+        return None
 
-    # Get valid company_ids (already strings from load_companies)
-    valid_ids = set(companies_df['company_id'])
     scored_ids = scored_df['company_id']
 
     # Identify orphaned companies
@@ -599,11 +866,7 @@ def _filter_orphaned_companies(scored_df: pd.DataFrame) -> pd.DataFrame:
             f"Sample: {orphaned_sample[:5]}"
         )
 
-        # Filter to only valid companies
-        filtered_df = scored_df[~orphaned_mask].copy()
-        return filtered_df
-
-    return scored_df
+    return orphaned_mask
 
 
 @st.cache_data(ttl=CACHE_TTL)
@@ -630,7 +893,7 @@ def load_penetration_by_company() -> pd.DataFrame:
         )
 
     try:
-        df = pd.read_csv(file_path)
+        df = _read_csv_cached(file_path)
     except Exception as e:
         raise DataLoadError(f"Failed to read {file_path}: {e}")
 
@@ -668,7 +931,7 @@ def load_contact_summary() -> pd.DataFrame:
         )
 
     try:
-        df = pd.read_csv(file_path)
+        df = _read_csv_cached(file_path)
     except Exception as e:
         raise DataLoadError(f"Failed to read {file_path}: {e}")
 
@@ -679,9 +942,10 @@ def load_contact_summary() -> pd.DataFrame:
         'contact_names', 'contact_emails'
     ]
     validate_schema(df, required_columns, "contact_summary.csv")
+    df = _categorize_company_ids(index_by_company_id(df))
 
     logger.info(f"Loaded {len(df)} contacts from {file_path}")
-    return df
+    return stamp_load_version(df)
 
 
 @st.cache_data(ttl=CACHE_TTL)
@@ -707,8 +971,7 @@ def load_research_enrichment() -> Dict[str, Any]:
         )
 
     try:
-        with open(file_path) as f:
-            data = json.load(f)
+        data = _read_json(file_path)
     except json.JSONDecodeError as e:
         raise DataLoadError(f"Invalid JSON in {file_path}: {e}")
     except Exception as e:
@@ -745,9 +1008,7 @@ def load_research_document(company_id: str) -> Optional[Dict[str, Any]]:
         return None
 
     try:
-        with open(file_path) as f:
-            doc = json.load(f)
-        return doc
+        return _read_json(file_path)
     except json.JSONDecodeError as e:
         logger.warning(f"Invalid JSON in research document {company_id}: {e}")
         return None
@@ -780,7 +1041,7 @@ def load_channels_config() -> Dict[str, Any]:
 
     try:
         with open(file_path) as f:
-            config = yaml.safe_load(f)
+            config = yaml.load(f, Loader=YAML_LOADER)
     except yaml.YAMLError as e:
         raise DataLoadError(f"Invalid YAML in {file_path}: {e}")
     except Exception as e:
@@ -814,7 +1075,7 @@ def load_company_research_data() -> Optional[pd.DataFrame]:
         return None
 
     try:
-        df = pd.read_csv(file_path, dtype={'company_id': str})
+        df = _read_csv_cached(file_path, dtype={'company_id': str})
 
         # Validate expected columns
         expected_columns = [
@@ -826,6 +1087,9 @@ def load_company_research_data() -> Optional[pd.DataFrame]:
         if missing:
             logger.warning(f"company_icp_scores_with_research.csv missing columns: {missing}")
 
+        # Index once per load so the detail page looks a company up by hash
+        df = index_by_company_id(df)
+
         logger.info(f"Loaded research data for {len(df)} companies from {file_path}")
         return df
     except Exception as e:
@@ -851,13 +1115,14 @@ def load_churn_predictions() -> Optional[pd.DataFrame]:
         return None
 
     try:
-        df = pd.read_csv(file_path)
+        df = _read_csv_cached(file_path)
 
         # Validate schema if file exists
         required_columns = [
             'company_id', 'churn_probability', 'risk_tier', 'prediction_date'
         ]
         validate_schema(df, required_columns, "churn_predictions.csv")
+        df = _categorize_company_ids(index_by_company_id(df))
 
         logger.info(f"Loaded {len(df)} churn predictions from {file_path}")
         return df
@@ -875,4 +1140,5 @@ def clear_cache():
     Spec: §4.3 Caching
     """
     st.cache_data.clear()
+    get_data_dir.cache_clear()
     logger.info("Cleared all data loader caches")
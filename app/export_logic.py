@@ -21,6 +21,8 @@ from openpyxl.styles import Font, PatternFill, Alignment
 from openpyxl.utils.dataframe import dataframe_to_rows
 from openpyxl.worksheet.worksheet import Worksheet
 
+from app.data_loader import parse_json
+
 logger = logging.getLogger(__name__)
 
 
@@ -99,7 +101,7 @@ def expand_json_array(json_str: Optional[str]) -> tuple[int, str]:
         return 0, ""
 
     try:
-        items = json.loads(json_str)
+        items = parse_json(json_str)
         if isinstance(items, list):
             count = len(items)
             formatted = "\n".join(items)
@@ -140,7 +142,7 @@ def expand_research_summary(json_str: Optional[str]) -> Dict[str, Any]:
         return result
 
     try:
-        summary = json.loads(json_str)
+        summary = parse_json(json_str)
 
         # News findings
         if 'news_findings' in summary:
@@ -9,6 +9,7 @@ import logging
 import sys
 from datetime import datetime
 from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
 
 # Add parent directory to path to allow 'app' module imports in Streamlit Cloud
 _page_dir = Path(__file__).resolve().parent
@@ -17,30 +18,137 @@ _project_root = _app_dir.parent
 if str(_project_root) not in sys.path:
     sys.path.insert(0, str(_project_root))
 
+import numpy as np
 import pandas as pd
 import streamlit as st
 
 from app.data_loader import (
+    CACHE_TTL,
     get_data_dir,
     load_companies,
     load_company_research_data,
     load_penetration_by_company,
     load_scored_companies,
 )
+from app.components.empty_states import EMPTY_COMPANIES_MSG
 from app.export_logic import merge_export_data, create_export_excel
 from app.ranked_companies_logic import (
-    get_empty_state_message,
     get_filtered_count_message,
     set_selected_company,
     sort_by_score_within_segment,
-    validate_rank_matches_score_order,
-    validate_segment_rank_contiguity,
+    validate_ranking_invariants,
 )
 from app.naics_rankings_logic import get_naics_description
 from app.quality_gates import check_entity_resolution_quality
 
 logger = logging.getLogger(__name__)
 
+# DataAxle growing_business_code -> Growth column label (unknown codes shown as-is)
+GROWTH_DISPLAY_MAP = {'G': '📈 High', '+': '↗️ Growing', 'C': '➡️ Stable', 'S': '➡️ Stable', '-': '📉 Declining'}
+
+# Low-cardinality columns stored as category in the cached base frame
+# (scoring_path already arrives as category from load_scored_companies; city
+# is left as object - ~2.2k distinct values over ~5.8k rows)
+CATEGORY_COLUMNS = ['state', 'naics_4digit', 'growing_business_code']
+
+# Row caps for the Company Rankings table. Every displayed row is serialized to
+# the browser on each rerun, so only the top rows are sent by default
+TABLE_ROW_LIMITS = [500, 1000, 2500, 'All']
+
+# Company Rankings table column configuration. Built with the page script, so
+# fragment reruns of render_rankings_table reuse it instead of rebuilding it
+RANKINGS_COLUMN_CONFIG = {
+    "company_id": None,  # Hide company_id column
+    "Rank": st.column_config.NumberColumn(
+        "Rank",
+        help="🏆 Position in filtered results, sorted by Final Score descending (1 = highest). Changes based on active filters.",
+        format="%d",
+        width="small"
+    ),
+    "Company": st.column_config.TextColumn(
+        "Company",
+        help="🏢 Company name from DataAxle database. Click any row to select this company and view full details on the Company Detail page.",
+        width="medium"
+    ),
+    "Path": st.column_config.TextColumn(
+        "Path",
+        help="🛤️ Customer Status / Scoring methodology: 'Prospect' (new customer - scored on industry + company attractiveness) or 'Customer Expansion' (existing customer - scored on expansion opportunity). ~97% are Prospects.",
+        width="small"
+    ),
+    "NAICS": st.column_config.TextColumn(
+        "NAICS",
+        help="🏭 4-digit NAICS industry code. All companies in same NAICS have same NAICS Score. Visit NAICS Rankings page to explore industries.",
+        width="small"
+    ),
+    "Final Score": st.column_config.NumberColumn(
+        "Final Score",
+        help="⭐ Overall opportunity score (0-100). For Prospects: (NAICS Score × 40%) + (Company Score × 60%). Higher = better opportunity. 90-100=Elite, 80-89=Strong, 70-79=Good, 60-69=Fair, <60=Lower priority.",
+        format="%.1f",
+        width="small"
+    ),
+    "NAICS Score": st.column_config.NumberColumn(
+        "NAICS Score",
+        help="🎯 Industry attractiveness (0-100). Based on: ICP Fit (25%), Market Size (15%), OW Revenue Concentration (15%), OW Building Count (20%), Revenue/Building (5%), Churn Health (15%), Ticket Health (5%). Same for all companies in this NAICS.",
+        format="%.1f",
+        width="small"
+    ),
+    "Company Score": st.column_config.NumberColumn(
+        "Company Score",
+        help="🏢 Company-specific opportunity (0-100). Based on: ICP Fit (50%), Buildings (20%), Revenue (15%), Employees (10%), Contacts (5%). Varies by company size and characteristics.",
+        format="%.1f",
+        width="small"
+    ),
+    "Employees": st.column_config.NumberColumn(
+        "Employees",
+        help="👥 Employee count at this location from DataAxle. Larger = bigger facilities, higher Company Score (10% weight). Example: 3,200 employees = likely large facility complex.",
+        format="%d",
+        width="small"
+    ),
+    "Revenue ($M)": st.column_config.TextColumn(
+        "Revenue ($M)",
+        help="💰 Annual revenue in millions from DataAxle. Higher revenue = higher Company Score (15% weight). Blank if not available. Example: 250.0 = $250M annual revenue.",
+        width="small"
+    ),
+    "Location": st.column_config.TextColumn(
+        "Location",
+        help="📍 Primary location (City, State) from DataAxle. Use State filter in sidebar to focus on specific regions.",
+        width="medium"
+    ),
+    "Customer": st.column_config.TextColumn(
+        "Customer",
+        help="✅ Existing OpenWorks customer indicator. ✅ = Currently active customer (matched via HubSpot entity resolution). Blank = Prospect. Some customers scored as 'Prospect' path for new business opportunities.",
+        width="small"
+    ),
+    "In HubSpot": st.column_config.TextColumn(
+        "In HubSpot",
+        help="📋 HubSpot presence indicator. ✅ = Company has a record in HubSpot (known to OpenWorks, may have buildings/contacts). Blank = Not in HubSpot yet (completely unknown). Companies can be in HubSpot but still be prospects (not yet customers).",
+        width="small"
+    ),
+    # Prospect component data (raw data instead of normalized scores)
+    "ICP Fit": st.column_config.TextColumn(
+        "ICP Fit",
+        help="🤖 Company ICP Fit Score (0-100) from Claude AI. Evaluates multi-location potential, facility type, operational fit, and similarity to successful customers. Worth 50% of Company Score! 70+=Strong fit, 40-69=Moderate, <40=Poor fit.",
+        width="small"
+    ),
+    "Buildings": st.column_config.NumberColumn(
+        "Buildings",
+        help="🏗️ Number of building locations from DataAxle. Multi-location companies score much higher (20% of Company Score). 10+=Excellent, 5-9=Good, 3-4=Fair, 1-2=Limited opportunity.",
+        format="%d",
+        width="small"
+    ),
+    "Growth": st.column_config.TextColumn(
+        "Growth",
+        help="📈 Growth indicator from DataAxle: 📈 High Growth (rapid expansion), ↗️ Growing (steady growth), ➡️ Stable (flat growth), 📉 Declining (contracting). Growing companies = better long-term prospects.",
+        width="small"
+    ),
+    "Contacts": st.column_config.NumberColumn(
+        "Contacts",
+        help="📞 Number of contacts available in our enriched database (worth 5% of Company Score). 75=We have contacts, 0=No contacts yet. Having contacts makes outreach easier.",
+        format="%d",
+        width="small"
+    ),
+}
+
 # Page header
 st.title("📊 Ranked Companies")
 
@@ -127,7 +235,115 @@ st.markdown("---")
 # DATA LOADING
 # =============================================================================
 
-try:
+def add_display_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Add the formatted Company Rankings table columns to the base frame.
+
+    Every display column depends only on its own row, so they are computed
+    once here on the full cached frame; reruns just slice and rank. Count
+    columns are int32 (largest values are in the hundreds of thousands).
+
+    Args:
+        df: Merged scored companies dataframe
+
+    Returns:
+        The same dataframe with display columns added
+    """
+    # Create display columns
+    df['Company'] = df['company_name']
+    df['Path'] = df['scoring_path']
+
+    # Score columns - keep as numeric for proper sorting
+    df['Final Score'] = df['final_score'].round(1)
+    df['NAICS Score'] = df['naics_attractiveness_score'].round(1)
+    df['Company Score'] = df['company_opportunity_score'].round(1)
+
+    # Company opportunity components
+    if 'location_employee_size' in df.columns:
+        df['Employees'] = df['location_employee_size'].fillna(0).astype('int32')
+    else:
+        df['Employees'] = 0
+
+    if 'sales_volume' in df.columns:
+        # Format sales volume in millions
+        revenue_m = df['sales_volume'].to_numpy(dtype=float) / 1_000_000
+        df['Revenue ($M)'] = np.where(revenue_m > 0, np.char.mod('%.1f', revenue_m), "—")
+    else:
+        df['Revenue ($M)'] = "—"
+
+    # Add location info
+    if 'city' in df.columns and 'state' in df.columns:
+        city, state = df['city'], df['state']
+        df['Location'] = (city.astype(str) + ', ' + state.astype(str)).where(
+            city.notna() & state.notna(), "—"
+        )
+    else:
+        df['Location'] = "—"
+
+    # Add NAICS code
+    naics = df['naics_4digit'].astype(float)
+    df['NAICS'] = np.where(naics.notna(), np.char.mod('%d', naics.fillna(0).to_numpy(dtype=float)), "—")
+
+    # Add customer indicator
+    df['Customer'] = np.where(df['is_customer'].astype(bool), "✅", "")
+
+    # Add HubSpot indicator
+    df['In HubSpot'] = np.where(df['in_hubspot'].astype(bool), "✅", "")
+
+    # Add raw data columns instead of normalized scores
+    # Building count
+    if 'building_count_estimate' in df.columns:
+        df['Buildings'] = pd.to_numeric(df['building_count_estimate'], errors='coerce').fillna(0).astype('int32')
+    else:
+        df['Buildings'] = 0
+
+    # ICP Fit Score (keep this as a score)
+    if 'icp_fit_score' in df.columns:
+        icp = df['icp_fit_score']
+        df['ICP Fit'] = np.where(icp.notna(), np.char.mod('%d', icp.fillna(0).to_numpy(dtype=float)), "—")
+    else:
+        df['ICP Fit'] = "—"
+
+    # Growth indicator (use growing_business_code if available)
+    if 'growing_business_code' in df.columns:
+        growth = df['growing_business_code']
+        growth_codes = growth.astype(str).str.strip().str.upper()
+        df['Growth'] = growth_codes.map(GROWTH_DISPLAY_MAP).fillna(growth_codes).where(growth.notna(), "—")
+    else:
+        df['Growth'] = "—"
+
+    # Contact count
+    if 'contacts_count' in df.columns:
+        df['Contacts'] = pd.to_numeric(df['contacts_count'], errors='coerce').fillna(0).astype('int32')
+    else:
+        df['Contacts'] = 0
+
+    return df
+
+
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False)
+def build_base_df() -> Tuple[pd.DataFrame, pd.Series, Optional[str]]:
+    """
+    Build the ranked-page base dataframe and penetration lookup.
+
+    Streamlit reruns this script on every widget interaction, so the loads,
+    company dedup/merge and HubSpot domain matching are cached together and
+    only the filters below run per interaction. The TTL matches the loaders
+    it wraps so new CSVs are still picked up, and Refresh clears it along
+    with the loader caches via clear_cache().
+
+    Returns:
+        Tuple of (scored_df with raw fields and in_hubspot, penetration_map,
+        hubspot_error). hubspot_error is None when HubSpot data loaded,
+        otherwise the error message (in_hubspot is then all False) - the
+        caller reports it, since st.error calls inside a cached function
+        are replayed on every hit
+
+    Raises:
+        AssertionError: If the segment ranking invariants do not hold
+
+    Spec: §2.5 Ranking Invariants
+    """
     # Load scored companies
     scored_df = load_scored_companies()
 
@@ -144,18 +360,27 @@ try:
 
     scored_df = scored_df.merge(raw_fields, on='company_id', how='left')
 
+    # Ranking invariants are a property of the loaded data, so check them once
+    # per load here; an AssertionError propagates and is not cached
+    validate_ranking_invariants(scored_df)
+
     # Load penetration data for display
     try:
         penetration_df = load_penetration_by_company()
-        penetration_map = dict(zip(
-            penetration_df['company_id'].astype(str),
-            penetration_df['penetration_rate']
-        ))
+        # Series keyed by company_id keeps the float dtype and supports both
+        # .get(cid) and bulk .reindex(ids); last row wins on duplicate ids,
+        # as the previous dict did
+        penetration_map = pd.Series(
+            penetration_df['penetration_rate'].to_numpy(),
+            index=penetration_df['company_id'].astype(str)
+        )
+        penetration_map = penetration_map[~penetration_map.index.duplicated(keep='last')]
     except Exception:
         # Penetration data is optional
-        penetration_map = {}
+        penetration_map = pd.Series(dtype=float)
 
     # Load HubSpot data to determine presence
+    hubspot_error = None
     try:
         # Load HubSpot companies
         hubspot_path = get_data_dir() / "raw" / "hubspot_companies.csv"
@@ -199,13 +424,46 @@ try:
             scored_df['in_hubspot'] = scored_df['company_id'].astype(str).map(company_domain_map).fillna(False)
     except Exception as e:
         # If we can't load HubSpot data, assume no matches
-        st.error(f"Error loading HubSpot data: {e}")
+        hubspot_error = str(e)
         scored_df['in_hubspot'] = False
 
+    # Repeated filter/display strings as categories - equality filters and
+    # the sidebar option lists then work on the small category set
+    for col in CATEGORY_COLUMNS:
+        if col in scored_df.columns:
+            scored_df[col] = scored_df[col].astype('category')
+
+    scored_df = add_display_columns(scored_df)
+
+    # Sort once by final score (highest first); boolean-mask filtering keeps
+    # this order, so the filtered view needs no per-rerun sort. The stable
+    # sort keeps tied scores in their segment rank order
+    scored_df = scored_df.sort_values('final_score', ascending=False, kind='stable', ignore_index=True)
+
+    return scored_df, penetration_map, hubspot_error
+
+
+try:
+    scored_df, penetration_map, hubspot_error = build_base_df()
+
+    # Raw company data is still needed for the export merges below
+    companies_df = load_companies()
+
+except AssertionError as e:
+    # Ranking invariant violated (checked in build_base_df)
+    st.error(f"🚨 **Ranking Validation Error**: {e}")
+    st.error("Please regenerate scored_companies.csv with correct rankings.")
+    st.stop()
+
 except Exception as e:
     st.error(f"Failed to load data: {e}")
     st.stop()
 
+if hubspot_error is not None:
+    st.error(f"Error loading HubSpot data: {hubspot_error}")
+    # Don't keep the degraded frame - the next rerun retries the HubSpot read
+    build_base_df.clear()
+
 # =============================================================================
 # DATA QUALITY WARNINGS
 # =============================================================================
@@ -222,22 +480,6 @@ if not er_passed:
         f"Contact and penetration information may be incomplete."
     )
 
-# =============================================================================
-# VALIDATE RANKING INVARIANTS
-# =============================================================================
-
-try:
-    # Validate segment rank contiguity
-    validate_segment_rank_contiguity(scored_df)
-
-    # Validate rank matches score order
-    validate_rank_matches_score_order(scored_df)
-
-except AssertionError as e:
-    st.error(f"🚨 **Ranking Validation Error**: {e}")
-    st.error("Please regenerate scored_companies.csv with correct rankings.")
-    st.stop()
-
 # =============================================================================
 # SIDEBAR FILTERS
 # =============================================================================
@@ -253,11 +495,13 @@ with st.sidebar:
     st.header("Filters")
 
     # Customer Status filter (renamed from Scoring Path)
-    scoring_paths = ['All'] + sorted(scored_df['scoring_path'].unique().tolist())
+    # Filter columns are categorical in the base frame, so the option lists come
+    # straight from the (small, null-free) category sets - no column scan
+    scoring_paths = ['All'] + sorted(scored_df['scoring_path'].cat.categories.tolist())
     selected_path = st.selectbox("Customer Status", scoring_paths, index=0)
 
     # NAICS filter
-    naics_codes = sorted([str(x) for x in scored_df['naics_4digit'].unique() if pd.notna(x)])
+    naics_codes = sorted([str(x) for x in scored_df['naics_4digit'].cat.categories])
     naics_options = ['All'] + naics_codes
 
     # Create mapping of NAICS codes to descriptions for display
@@ -287,7 +531,7 @@ with st.sidebar:
 
     # State filter
     if 'state' in scored_df.columns:
-        state_options = ['All'] + sorted([str(x) for x in scored_df['state'].unique() if pd.notna(x)])
+        state_options = ['All'] + sorted([str(x) for x in scored_df['state'].cat.categories])
         selected_state = st.selectbox("State", state_options, index=0)
     else:
         selected_state = 'All'
@@ -317,39 +561,54 @@ with st.sidebar:
 # APPLY FILTERS
 # =============================================================================
 
-filtered_df = scored_df.copy()
+# Compose all filters into one boolean mask and slice once, rather than
+# materializing an intermediate frame per filter
+mask = np.ones(len(scored_df), dtype=bool)
 
 # Apply customer status filter (scoring path)
 if selected_path != 'All':
-    filtered_df = filtered_df[filtered_df['scoring_path'] == selected_path]
+    mask &= (scored_df['scoring_path'] == selected_path).to_numpy()
 
 # Apply NAICS filter
+# (match on the category code - the options are the str() of the categories -
+# instead of re-stringifying the whole column)
 if selected_naics != 'All':
-    filtered_df = filtered_df[filtered_df['naics_4digit'].astype(str) == selected_naics]
+    naics = scored_df['naics_4digit']
+    naics_code = naics.cat.categories.astype(str).get_indexer([selected_naics])[0]
+    if naics_code >= 0:
+        mask &= naics.cat.codes.to_numpy() == naics_code
+    else:
+        mask[:] = False
 
 # Debug: Show filter status if navigated from NAICS Rankings
 if naics_from_rankings:
     st.sidebar.markdown(f"**Debug:** Applied NAICS filter = `{selected_naics}`")
-    st.sidebar.markdown(f"**Debug:** Companies after filter = `{len(filtered_df)}`")
+    st.sidebar.markdown(f"**Debug:** Companies after filter = `{int(mask.sum())}`")
 
 # Apply HubSpot status filter
 if selected_hubspot == 'In HubSpot':
-    filtered_df = filtered_df[filtered_df['in_hubspot'] == True]
+    mask &= (scored_df['in_hubspot'] == True).to_numpy()
 elif selected_hubspot == 'Not in HubSpot':
-    filtered_df = filtered_df[filtered_df['in_hubspot'] == False]
+    mask &= (scored_df['in_hubspot'] == False).to_numpy()
 
 # Apply state filter
-if selected_state != 'All' and 'state' in filtered_df.columns:
-    filtered_df = filtered_df[filtered_df['state'] == selected_state]
+if selected_state != 'All' and 'state' in scored_df.columns:
+    mask &= (scored_df['state'] == selected_state).to_numpy()
 
 # Apply score range filter
-filtered_df = filtered_df[
-    (filtered_df['final_score'] >= min_score) &
-    (filtered_df['final_score'] <= max_score)
-]
-
-# Sort by final score descending (highest scores first)
-filtered_df = filtered_df.sort_values('final_score', ascending=False)
+# scored_df is sorted by final_score descending (NaN last), so the range is one
+# contiguous block of rows - find its bounds by binary search on the ascending
+# view of the scored prefix instead of comparing every row twice
+final_scores = scored_df['final_score'].to_numpy()
+scored_count = len(final_scores) - int(np.isnan(final_scores).sum())
+scores_asc = final_scores[:scored_count][::-1]
+range_start = scored_count - int(np.searchsorted(scores_asc, max_score, side='right'))
+range_end = scored_count - int(np.searchsorted(scores_asc, min_score, side='left'))
+mask[:range_start] = False
+mask[range_end:] = False
+
+# scored_df is already sorted by final_score descending and masking keeps that order
+filtered_df = scored_df[mask]
 
 # =============================================================================
 # DISPLAY COUNTS AND SUMMARY
@@ -358,32 +617,29 @@ filtered_df = filtered_df.sort_values('final_score', ascending=False)
 total_count = len(scored_df)
 filtered_count = len(filtered_df)
 
-# Summary metrics
+# Summary metrics - customers are counted once and prospects derived from the
+# total (is_customer is boolean) instead of scanning the column twice
+if filtered_count > 0:
+    avg_score_display = f"{filtered_df['final_score'].mean():.1f}"
+    customer_count = int(filtered_df['is_customer'].to_numpy().sum())
+    customer_display = f"{customer_count:,}"
+    prospect_display = f"{filtered_count - customer_count:,}"
+else:
+    avg_score_display = customer_display = prospect_display = "—"
+
 col1, col2, col3, col4 = st.columns(4)
 
 with col1:
     st.metric("Total Companies", f"{filtered_count:,} / {total_count:,}")
 
 with col2:
-    if filtered_count > 0:
-        avg_score = filtered_df['final_score'].mean()
-        st.metric("Avg Score", f"{avg_score:.1f}")
-    else:
-        st.metric("Avg Score", "—")
+    st.metric("Avg Score", avg_score_display)
 
 with col3:
-    if filtered_count > 0:
-        customer_count = filtered_df['is_customer'].sum()
-        st.metric("Customers", f"{customer_count:,}")
-    else:
-        st.metric("Customers", "—")
+    st.metric("Customers", customer_display)
 
 with col4:
-    if filtered_count > 0:
-        prospect_count = (~filtered_df['is_customer']).sum()
-        st.metric("Prospects", f"{prospect_count:,}")
-    else:
-        st.metric("Prospects", "—")
+    st.metric("Prospects", prospect_display)
 
 # Refresh button
 col1, col2 = st.columns([6, 1])
@@ -398,91 +654,13 @@ with col2:
 # =============================================================================
 
 if len(filtered_df) == 0:
-    st.warning(get_empty_state_message())
+    st.warning(EMPTY_COMPANIES_MSG)
     st.stop()
 
 # =============================================================================
 # PREPARE DISPLAY DATAFRAME
 # =============================================================================
 
-display_df = filtered_df.copy()
-
-# Add global rank based on current sort order (by final_score descending)
-display_df = display_df.reset_index(drop=True)
-display_df['Rank'] = range(1, len(display_df) + 1)
-
-# Create display columns
-display_df['Company'] = display_df['company_name']
-display_df['Path'] = display_df['scoring_path']
-
-# Score columns - keep as numeric for proper sorting
-display_df['Final Score'] = display_df['final_score'].round(1)
-display_df['NAICS Score'] = display_df['naics_attractiveness_score'].round(1)
-display_df['Company Score'] = display_df['company_opportunity_score'].round(1)
-
-# Company opportunity components
-if 'location_employee_size' in display_df.columns:
-    display_df['Employees'] = display_df['location_employee_size'].fillna(0).astype(int)
-else:
-    display_df['Employees'] = 0
-
-if 'sales_volume' in display_df.columns:
-    # Format sales volume in millions
-    display_df['Revenue ($M)'] = display_df['sales_volume'].apply(
-        lambda x: f"{x/1_000_000:.1f}" if pd.notna(x) and x > 0 else "—"
-    )
-else:
-    display_df['Revenue ($M)'] = "—"
-
-# Add location info
-if 'city' in display_df.columns and 'state' in display_df.columns:
-    display_df['Location'] = display_df.apply(
-        lambda row: f"{row['city']}, {row['state']}" if pd.notna(row['city']) and pd.notna(row['state']) else "—",
-        axis=1
-    )
-else:
-    display_df['Location'] = "—"
-
-# Add NAICS code
-display_df['NAICS'] = display_df['naics_4digit'].apply(lambda x: str(int(x)) if pd.notna(x) else "—")
-
-# Add customer indicator
-display_df['Customer'] = display_df['is_customer'].apply(lambda x: "✅" if x else "")
-
-# Add HubSpot indicator
-display_df['In HubSpot'] = display_df['in_hubspot'].apply(lambda x: "✅" if x else "")
-
-# Add raw data columns instead of normalized scores
-# Building count
-if 'building_count_estimate' in display_df.columns:
-    display_df['Buildings'] = display_df['building_count_estimate'].fillna(0).astype(int)
-else:
-    display_df['Buildings'] = 0
-
-# ICP Fit Score (keep this as a score)
-if 'icp_fit_score' in display_df.columns:
-    display_df['ICP Fit'] = display_df['icp_fit_score'].apply(lambda x: f"{int(x)}" if pd.notna(x) else "—")
-else:
-    display_df['ICP Fit'] = "—"
-
-# Growth indicator (use growing_business_code if available)
-if 'growing_business_code' in display_df.columns:
-    def format_growth(code):
-        if pd.isna(code):
-            return "—"
-        code_str = str(code).strip().upper()
-        mapping = {'G': '📈 High', '+': '↗️ Growing', 'C': '➡️ Stable', 'S': '➡️ Stable', '-': '📉 Declining'}
-        return mapping.get(code_str, code_str)
-    display_df['Growth'] = display_df['growing_business_code'].apply(format_growth)
-else:
-    display_df['Growth'] = "—"
-
-# Contact count
-if 'contacts_count' in display_df.columns:
-    display_df['Contacts'] = pd.to_numeric(display_df['contacts_count'], errors='coerce').fillna(0).astype(int)
-else:
-    display_df['Contacts'] = 0
-
 # NOTE: Growing Business Code and Digital Presence are no longer separate factors
 # They are now captured within the ICP Fit Score assessment
 
@@ -493,7 +671,7 @@ else:
 
 # Select columns for display (prospect components only)
 display_columns = [
-    'company_id', 'Rank', 'Company', 'Path', 'NAICS', 'Final Score',
+    'company_id', 'Company', 'Path', 'NAICS', 'Final Score',
     'Company Score', 'Location', 'In HubSpot',
     # Prospect components (shown for all companies) - Raw data instead of normalized scores
     'ICP Fit', 'Buildings', 'Growth', 'Contacts',
@@ -501,174 +679,167 @@ display_columns = [
     'NAICS Score', 'Employees', 'Revenue ($M)'
 ]
 
-# Only include columns that exist in the dataframe
-display_columns = [col for col in display_columns if col in display_df.columns]
-
-result_df = display_df[display_columns].copy()
+# Display columns are precomputed on the cached base frame (add_display_columns),
+# so each rerun only projects the filtered rows and numbers them. Rank is global
+# position in the current sort order (by final_score descending)
+display_columns = [col for col in display_columns if col in filtered_df.columns]
+result_df = filtered_df[display_columns].reset_index(drop=True)
+result_df.insert(1, 'Rank', np.arange(1, len(result_df) + 1))
 
 # =============================================================================
 # DISPLAY TABLE WITH ROW SELECTION
 # =============================================================================
 
-st.markdown("---")
-st.markdown("### 📋 Company Rankings")
-st.markdown("**Select companies** using checkboxes, then export to Excel. Or click a single row to view Company Detail page.")
-
-# Display companies table with row selection enabled
-event = st.dataframe(
-    result_df,
-    use_container_width=True,
-    height=600,
-    hide_index=True,
-    on_select="rerun",
-    selection_mode=["multi-row"],
-    key="ranked_companies_table",
-    column_config={
-        "company_id": None,  # Hide company_id column
-        "Rank": st.column_config.NumberColumn(
-            "Rank",
-            help="🏆 Position in filtered results, sorted by Final Score descending (1 = highest). Changes based on active filters.",
-            format="%d",
-            width="small"
-        ),
-        "Company": st.column_config.TextColumn(
-            "Company",
-            help="🏢 Company name from DataAxle database. Click any row to select this company and view full details on the Company Detail page.",
-            width="medium"
-        ),
-        "Path": st.column_config.TextColumn(
-            "Path",
-            help="🛤️ Customer Status / Scoring methodology: 'Prospect' (new customer - scored on industry + company attractiveness) or 'Customer Expansion' (existing customer - scored on expansion opportunity). ~97% are Prospects.",
-            width="small"
-        ),
-        "NAICS": st.column_config.TextColumn(
-            "NAICS",
-            help="🏭 4-digit NAICS industry code. All companies in same NAICS have same NAICS Score. Visit NAICS Rankings page to explore industries.",
-            width="small"
-        ),
-        "Final Score": st.column_config.NumberColumn(
-            "Final Score",
-            help="⭐ Overall opportunity score (0-100). For Prospects: (NAICS Score × 40%) + (Company Score × 60%). Higher = better opportunity. 90-100=Elite, 80-89=Strong, 70-79=Good, 60-69=Fair, <60=Lower priority.",
-            format="%.1f",
-            width="small"
-        ),
-        "NAICS Score": st.column_config.NumberColumn(
-            "NAICS Score",
-            help="🎯 Industry attractiveness (0-100). Based on: ICP Fit (25%), Market Size (15%), OW Revenue Concentration (15%), OW Building Count (20%), Revenue/Building (5%), Churn Health (15%), Ticket Health (5%). Same for all companies in this NAICS.",
-            format="%.1f",
-            width="small"
-        ),
-        "Company Score": st.column_config.NumberColumn(
-            "Company Score",
-            help="🏢 Company-specific opportunity (0-100). Based on: ICP Fit (50%), Buildings (20%), Revenue (15%), Employees (10%), Contacts (5%). Varies by company size and characteristics.",
-            format="%.1f",
-            width="small"
-        ),
-        "Employees": st.column_config.NumberColumn(
-            "Employees",
-            help="👥 Employee count at this location from DataAxle. Larger = bigger facilities, higher Company Score (10% weight). Example: 3,200 employees = likely large facility complex.",
-            format="%d",
-            width="small"
-        ),
-        "Revenue ($M)": st.column_config.TextColumn(
-            "Revenue ($M)",
-            help="💰 Annual revenue in millions from DataAxle. Higher revenue = higher Company Score (15% weight). Blank if not available. Example: 250.0 = $250M annual revenue.",
-            width="small"
-        ),
-        "Location": st.column_config.TextColumn(
-            "Location",
-            help="📍 Primary location (City, State) from DataAxle. Use State filter in sidebar to focus on specific regions.",
-            width="medium"
-        ),
-        "Customer": st.column_config.TextColumn(
-            "Customer",
-            help="✅ Existing OpenWorks customer indicator. ✅ = Currently active customer (matched via HubSpot entity resolution). Blank = Prospect. Some customers scored as 'Prospect' path for new business opportunities.",
-            width="small"
-        ),
-        "In HubSpot": st.column_config.TextColumn(
-            "In HubSpot",
-            help="📋 HubSpot presence indicator. ✅ = Company has a record in HubSpot (known to OpenWorks, may have buildings/contacts). Blank = Not in HubSpot yet (completely unknown). Companies can be in HubSpot but still be prospects (not yet customers).",
-            width="small"
-        ),
-        # Prospect component data (raw data instead of normalized scores)
-        "ICP Fit": st.column_config.TextColumn(
-            "ICP Fit",
-            help="🤖 Company ICP Fit Score (0-100) from Claude AI. Evaluates multi-location potential, facility type, operational fit, and similarity to successful customers. Worth 50% of Company Score! 70+=Strong fit, 40-69=Moderate, <40=Poor fit.",
-            width="small"
-        ),
-        "Buildings": st.column_config.NumberColumn(
-            "Buildings",
-            help="🏗️ Number of building locations from DataAxle. Multi-location companies score much higher (20% of Company Score). 10+=Excellent, 5-9=Good, 3-4=Fair, 1-2=Limited opportunity.",
-            format="%d",
-            width="small"
-        ),
-        "Growth": st.column_config.TextColumn(
-            "Growth",
-            help="📈 Growth indicator from DataAxle: 📈 High Growth (rapid expansion), ↗️ Growing (steady growth), ➡️ Stable (flat growth), 📉 Declining (contracting). Growing companies = better long-term prospects.",
-            width="small"
-        ),
-        "Contacts": st.column_config.NumberColumn(
-            "Contacts",
-            help="📞 Number of contacts available in our enriched database (worth 5% of Company Score). 75=We have contacts, 0=No contacts yet. Having contacts makes outreach easier.",
-            format="%d",
-            width="small"
-        ),
-    }
-)
-
-# Handle row selection
-selected_company_ids = []
-if event.selection.rows:
-    selected_indices = event.selection.rows
-    selected_company_ids = result_df.iloc[selected_indices]['company_id'].tolist()
-
-    # Store all selected companies in session state
-    st.session_state['selected_company_ids'] = selected_company_ids
+@st.fragment
+def render_rankings_table(
+    result_df: pd.DataFrame,
+    scored_df: pd.DataFrame,
+    companies_df: pd.DataFrame,
+    filter_info: Dict[str, Any]
+) -> None:
+    """
+    Render the Company Rankings table, selection handling and export controls.
+
+    Runs as a fragment: row selections, the row-limit selectbox and the
+    download buttons rerun only this function, not the data loading and
+    filtering above. Sidebar filter changes still rerun the full page
+    (fragments cannot write to the sidebar).
+
+    Args:
+        result_df: Filtered display frame in rank order
+        scored_df: Cached base frame (export source)
+        companies_df: Raw companies frame (export source)
+        filter_info: Active filters for the export metadata sheet
+    """
+    st.markdown("---")
+    st.markdown("### 📋 Company Rankings")
+    st.markdown("**Select companies** using checkboxes, then export to Excel. Or click a single row to view Company Detail page.")
+
+    row_limit = st.selectbox("Rows to display", TABLE_ROW_LIMITS, index=0, key="table_row_limit")
+    if row_limit != 'All' and len(result_df) > row_limit:
+        # result_df is in rank order, so the head is the top of the ranking
+        table_df = result_df.head(row_limit)
+        st.caption(
+            f"Showing the top {row_limit:,} of {len(result_df):,} companies. "
+            f"Column sorting applies to the rows shown; Export All includes every filtered company."
+        )
+    else:
+        table_df = result_df
+
+    # Display companies table with row selection enabled
+    event = st.dataframe(
+        table_df,
+        use_container_width=True,
+        height=600,
+        hide_index=True,
+        on_select="rerun",
+        selection_mode=["multi-row"],
+        key="ranked_companies_table",
+        column_config=RANKINGS_COLUMN_CONFIG
+    )
 
-    # Also store company names for display
-    selected_company_names = result_df.iloc[selected_indices]['Company'].tolist()
-    st.session_state['selected_company_names'] = selected_company_names
+    # Handle row selection
+    selected_company_ids = []
+    if event.selection.rows:
+        selected_indices = event.selection.rows
+        selected_company_ids = table_df.iloc[selected_indices]['company_id'].tolist()
 
-    # If only one company selected, also set in session state for Company Detail navigation
-    if len(selected_company_ids) == 1:
-        selected_company_id = selected_company_ids[0]
-        selected_company_name = selected_company_names[0]
+        # Store all selected companies in session state
+        st.session_state['selected_company_ids'] = selected_company_ids
 
-        # Set selected company in session state (for backward compatibility)
-        set_selected_company(selected_company_id)
+        # Also store company names for display
+        selected_company_names = table_df.iloc[selected_indices]['Company'].tolist()
+        st.session_state['selected_company_names'] = selected_company_names
 
-        # Show confirmation message
-        st.success(f"✅ Selected: **{selected_company_name}**")
-        st.info("👉 Navigate to the **Company Detail** page using the sidebar to view full information.")
-    else:
-        # Multiple companies selected
-        st.info(f"**{len(selected_company_ids)} companies selected** - Ready to export to Excel or view details")
-        st.info("👉 Navigate to the **Company Detail** page to view all selected companies")
+        # If only one company selected, also set in session state for Company Detail navigation
+        if len(selected_company_ids) == 1:
+            selected_company_id = selected_company_ids[0]
+            selected_company_name = selected_company_names[0]
 
-# =============================================================================
-# EXPORT CONTROLS (AFTER TABLE)
-# =============================================================================
+            # Set selected company in session state (for backward compatibility)
+            set_selected_company(selected_company_id)
 
-st.markdown("---")
-st.markdown("### 📥 Export Companies")
-
-col1, col2, col3 = st.columns([4, 3, 3])
-
-with col1:
-    st.markdown("Export selected companies or all companies in the current filtered view.")
+            # Show confirmation message
+            st.success(f"✅ Selected: **{selected_company_name}**")
+            st.info("👉 Navigate to the **Company Detail** page using the sidebar to view full information.")
+        else:
+            # Multiple companies selected
+            st.info(f"**{len(selected_company_ids)} companies selected** - Ready to export to Excel or view details")
+            st.info("👉 Navigate to the **Company Detail** page to view all selected companies")
 
-with col2:
-    # Placeholder for selected companies export button
-    export_placeholder = st.empty()
+    # =============================================================================
+    # EXPORT CONTROLS (AFTER TABLE)
+    # =============================================================================
 
-with col3:
-    # Export all filtered companies button
-    export_all_placeholder = st.empty()
+    st.markdown("---")
+    st.markdown("### 📥 Export Companies")
+
+    col1, col2, col3 = st.columns([4, 3, 3])
+
+    with col1:
+        st.markdown("Export selected companies or all companies in the current filtered view.")
+
+    with col2:
+        # Placeholder for selected companies export button
+        export_placeholder = st.empty()
+
+    with col3:
+        # Export all filtered companies button
+        export_all_placeholder = st.empty()
+
+    # Show download button if companies are selected
+    if len(selected_company_ids) > 0:
+        with export_placeholder:
+            # Generate export data on demand
+            try:
+                # Load research data
+                research_df = load_company_research_data()
+
+                # Create HubSpot flags dict (already computed earlier)
+                company_domain_map = dict(zip(
+                    scored_df['company_id'].astype(str),
+                    scored_df.get('in_hubspot', [False] * len(scored_df))
+                ))
+
+                # Merge data for selected companies
+                merged_df = merge_export_data(
+                    scored_df,
+                    research_df,
+                    companies_df,
+                    [str(cid) for cid in selected_company_ids],
+                    company_domain_map
+                )
+
+                # Create Excel file in memory
+                output = io.BytesIO()
+                create_export_excel(merged_df, filter_info, output)
+                output.seek(0)
+
+                # Generate filename
+                timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+                filename = f"openworks_companies_export_{timestamp}.xlsx"
+
+                # Single download button
+                st.download_button(
+                    label=f"📥 Download {len(selected_company_ids)} {'Company' if len(selected_company_ids) == 1 else 'Companies'} Excel Export",
+                    data=output.getvalue(),
+                    file_name=filename,
+                    mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+                    type="primary",
+                    key="download_excel_direct"
+                )
+
+            except Exception as e:
+                st.error(f"Export preparation failed: {e}")
+                logger.error(f"Excel export error: {e}", exc_info=True)
+                import traceback
+                st.code(traceback.format_exc())
+
+    # Show "Export All" button for all filtered companies
+    with export_all_placeholder:
+        # Get all company IDs from filtered results
+        all_filtered_company_ids = result_df['company_id'].tolist()
 
-# Show download button if companies are selected
-if len(selected_company_ids) > 0:
-    with export_placeholder:
-        # Generate export data on demand
         try:
             # Load research data
             research_df = load_company_research_data()
@@ -679,25 +850,15 @@ if len(selected_company_ids) > 0:
                 scored_df.get('in_hubspot', [False] * len(scored_df))
             ))
 
-            # Merge data for selected companies
+            # Merge data for all filtered companies
             merged_df = merge_export_data(
                 scored_df,
                 research_df,
                 companies_df,
-                [str(cid) for cid in selected_company_ids],
+                [str(cid) for cid in all_filtered_company_ids],
                 company_domain_map
             )
 
-            # Create filter info for metadata sheet
-            filter_info = {
-                'customer_status': selected_path,
-                'naics_code': selected_naics,
-                'hubspot_status': selected_hubspot,
-                'state': selected_state,
-                'score_min': min_score,
-                'score_max': max_score
-            }
-
             # Create Excel file in memory
             output = io.BytesIO()
             create_export_excel(merged_df, filter_info, output)
@@ -705,80 +866,34 @@ if len(selected_company_ids) > 0:
 
             # Generate filename
             timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-            filename = f"openworks_companies_export_{timestamp}.xlsx"
+            filename = f"openworks_all_companies_export_{timestamp}.xlsx"
 
-            # Single download button
+            # Export all button
             st.download_button(
-                label=f"📥 Download {len(selected_company_ids)} {'Company' if len(selected_company_ids) == 1 else 'Companies'} Excel Export",
+                label=f"📥 Export All {len(all_filtered_company_ids)} Companies",
                 data=output.getvalue(),
                 file_name=filename,
                 mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-                type="primary",
-                key="download_excel_direct"
+                key="download_all_excel",
+                help=f"Export all {len(all_filtered_company_ids)} companies in the current filtered view"
             )
 
         except Exception as e:
-            st.error(f"Export preparation failed: {e}")
-            logger.error(f"Excel export error: {e}", exc_info=True)
-            import traceback
-            st.code(traceback.format_exc())
+            st.error(f"Export all preparation failed: {e}")
+            logger.error(f"Excel export all error: {e}", exc_info=True)
 
-# Show "Export All" button for all filtered companies
-with export_all_placeholder:
-    # Get all company IDs from filtered results
-    all_filtered_company_ids = result_df['company_id'].tolist()
 
-    try:
-        # Load research data
-        research_df = load_company_research_data()
-
-        # Create HubSpot flags dict (already computed earlier)
-        company_domain_map = dict(zip(
-            scored_df['company_id'].astype(str),
-            scored_df.get('in_hubspot', [False] * len(scored_df))
-        ))
-
-        # Merge data for all filtered companies
-        merged_df = merge_export_data(
-            scored_df,
-            research_df,
-            companies_df,
-            [str(cid) for cid in all_filtered_company_ids],
-            company_domain_map
-        )
+# Active filters for the export metadata sheet
+filter_info = {
+    'customer_status': selected_path,
+    'naics_code': selected_naics,
+    'hubspot_status': selected_hubspot,
+    'state': selected_state,
+    'score_min': min_score,
+    'score_max': max_score
+}
 
-        # Create filter info for metadata sheet
-        filter_info = {
-            'customer_status': selected_path,
-            'naics_code': selected_naics,
-            'hubspot_status': selected_hubspot,
-            'state': selected_state,
-            'score_min': min_score,
-            'score_max': max_score
-        }
-
-        # Create Excel file in memory
-        output = io.BytesIO()
-        create_export_excel(merged_df, filter_info, output)
-        output.seek(0)
-
-        # Generate filename
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        filename = f"openworks_all_companies_export_{timestamp}.xlsx"
-
-        # Export all button
-        st.download_button(
-            label=f"📥 Export All {len(all_filtered_company_ids)} Companies",
-            data=output.getvalue(),
-            file_name=filename,
-            mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-            key="download_all_excel",
-            help=f"Export all {len(all_filtered_company_ids)} companies in the current filtered view"
-        )
-
-    except Exception as e:
-        st.error(f"Export all preparation failed: {e}")
-        logger.error(f"Excel export all error: {e}", exc_info=True)
+render_rankings_table(result_df, scored_df, companies_df, filter_info)
 
 # =============================================================================
 # FOOTER INFO
@@ -23,22 +23,25 @@ import pandas as pd
 import streamlit as st
 
 from app.company_detail_logic import (
-    calculate_penetration_rate,
+    calculate_building_metrics,
     format_buildings_display,
     format_company_info,
     format_contacts_display,
+    format_hq_info,
     format_score_components,
+    format_scoring_breakdown,
     get_company_buildings,
     get_company_by_id,
     get_company_contacts,
     get_company_not_found_message,
     get_churn_prediction,
-    get_no_company_selected_message,
+    get_research_record,
     get_scored_company_by_id,
     get_selected_company_id,
     has_churn_data,
     metric_with_tooltip,
 )
+from app.components.empty_states import NO_COMPANY_SELECTED_MSG
 from app.components.research_viewer import render_research_document
 from app.components.score_display import (
     format_score,
@@ -53,12 +56,16 @@ from app.data_loader import (
     load_contact_summary,
     load_research_document,
     load_scored_companies,
+    parse_json,
 )
 from app.quality_gates import validate_scoring_weights
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
+# Detail views, in display order
+DETAIL_TABS = ["📋 Company Info", "📊 Scoring", "🎯 ICP Research", "⚠️ Churn"]
+
 # Page header
 st.title("🏢 Company Detail")
 
@@ -74,7 +81,7 @@ selected_company_names = st.session_state.get('selected_company_names', [])
 if not selected_company_ids:
     company_id = get_selected_company_id()
     if not company_id:
-        st.warning(get_no_company_selected_message())
+        st.warning(NO_COMPANY_SELECTED_MSG)
         st.stop()
     selected_company_ids = [company_id]
     selected_company_names = [None]  # Will be filled in later
@@ -160,28 +167,28 @@ st.markdown("---")
 # TABS
 # =============================================================================
 
-tab1, tab2, tab3, tab4 = st.tabs([
-    "📋 Company Info",
-    "📊 Scoring",
-    "🎯 ICP Research",
-    "⚠️ Churn"
-])
+# A horizontal radio instead of st.tabs: st.tabs runs every tab body on each
+# rerun, while this only executes the selected view (JSON parsing, research and
+# churn lookups are skipped for the tabs not being looked at)
+active_tab = st.radio(
+    "View",
+    DETAIL_TABS,
+    horizontal=True,
+    key="detail_active_tab",
+    label_visibility="collapsed"
+)
 
 # =============================================================================
 # TAB 1: COMPANY INFO (Consolidated: Info + HQ Info + Contacts)
 # =============================================================================
 
-with tab1:
+if active_tab == DETAIL_TABS[0]:
     st.subheader("Company Information")
 
     info = format_company_info(company)
 
     # Get HQ info
-    from app.company_detail_logic import format_hq_info
-    company_with_sales = company.copy()
-    if 'sales_volume' not in company_with_sales or pd.isna(company_with_sales.get('sales_volume')):
-        company_with_sales['sales_volume'] = scored.get('sales_volume')
-    hq_info = format_hq_info(company_with_sales)
+    hq_info = format_hq_info(company, sales_volume_fallback=scored.get('sales_volume'))
 
     # Basic Company Details
     col1, col2, col3 = st.columns(3)
@@ -254,22 +261,21 @@ with tab1:
     st.markdown("---")
     st.subheader("Penetration Metrics")
 
-    penetration_rate = calculate_penetration_rate(buildings)
+    total_buildings, served_count, penetration_rate = calculate_building_metrics(buildings)
 
     col1, col2, col3 = st.columns(3)
 
     with col1:
         metric_with_tooltip(
             "Total Buildings",
-            str(len(buildings)),
+            str(total_buildings),
             "🏢 Total number of buildings/locations discovered for this company through research and entity resolution. This is the actual count from our building database, which may be more accurate than the DataAxle estimate above."
         )
 
     with col2:
-        served_count = buildings['is_served'].sum()
         metric_with_tooltip(
             "Served Buildings",
-            str(int(served_count)),
+            str(served_count),
             "✅ Number of buildings currently served by OpenWorks (matched to HubSpot building records). These are active service locations where OpenWorks has existing contracts and relationships."
         )
 
@@ -307,7 +313,7 @@ with tab1:
         # Parse and display primary contact if available
         if pd.notna(primary_contact_str):
             try:
-                primary_contact = json.loads(primary_contact_str)
+                primary_contact = parse_json(primary_contact_str)
 
                 with col2:
                     # Build contact name
@@ -344,8 +350,8 @@ with tab1:
                     contact_details.append(f"**Gender:** {gender}")
 
                 if contact_details:
-                    for detail in contact_details:
-                        st.markdown(f"- {detail}")
+                    # One markdown element for the whole list
+                    st.markdown("\n".join(f"- {detail}" for detail in contact_details))
                 else:
                     st.info("Primary contact name available, but no additional details.")
 
@@ -367,11 +373,9 @@ with tab1:
 # TAB 2: SCORING
 # =============================================================================
 
-with tab2:
+if active_tab == DETAIL_TABS[1]:
     st.subheader("Scoring Breakdown")
 
-    from app.company_detail_logic import format_scoring_breakdown
-
     # Get scoring breakdown
     breakdown = format_scoring_breakdown(scored)
 
@@ -607,15 +611,11 @@ with tab2:
 # TAB 3: ICP RESEARCH
 # =============================================================================
 
-with tab3:
+if active_tab == DETAIL_TABS[2]:
     st.subheader("ICP Fit Assessment & Web Research")
 
     # Load detailed research data from company_icp_scores_with_research.csv
-    research_record = None
-    if research_data_df is not None:
-        research_matches = research_data_df[research_data_df['company_id'] == company_id]
-        if len(research_matches) > 0:
-            research_record = research_matches.iloc[0]
+    research_record = get_research_record(company_id, research_data_df)
 
     # =============================================================================
     # ICP FIT METRICS
@@ -678,10 +678,9 @@ with tab3:
         if pd.notna(research_record.get('hot_lead_signals')):
             st.markdown("#### 🔥 Hot Lead Signals")
             try:
-                signals = json.loads(research_record['hot_lead_signals'])
+                signals = parse_json(research_record['hot_lead_signals'])
                 if signals:
-                    for signal in signals:
-                        st.markdown(f"- {signal}")
+                    st.markdown("\n".join(f"- {signal}" for signal in signals))
                 else:
                     st.info("No hot lead signals identified")
             except:
@@ -691,10 +690,9 @@ with tab3:
         if pd.notna(research_record.get('concerns')):
             st.markdown("#### ⚠️ Concerns")
             try:
-                concerns = json.loads(research_record['concerns'])
+                concerns = parse_json(research_record['concerns'])
                 if concerns:
-                    for concern in concerns:
-                        st.markdown(f"- {concern}")
+                    st.markdown("\n".join(f"- {concern}" for concern in concerns))
                 else:
                     st.info("No major concerns identified")
             except:
@@ -710,7 +708,7 @@ with tab3:
             st.markdown("---")
             with st.expander("📊 View Detailed Research Summary", expanded=False):
                 try:
-                    summary = json.loads(research_record['research_summary'])
+                    summary = parse_json(research_record['research_summary'])
 
                     # Display news findings
                     if 'news_findings' in summary:
@@ -734,8 +732,7 @@ with tab3:
                         st.markdown(f"**Summary:** {jobs.get('summary', 'N/A')}")
                         if jobs.get('role_examples'):
                             st.markdown("**Example Roles:**")
-                            for role in jobs['role_examples'][:5]:
-                                st.markdown(f"- {role}")
+                            st.markdown("\n".join(f"- {role}" for role in jobs['role_examples'][:5]))
                         st.markdown("---")
 
                     # Display corporate operations findings
@@ -762,7 +759,7 @@ with tab3:
 # TAB 4: CHURN
 # =============================================================================
 
-with tab4:
+if active_tab == DETAIL_TABS[3]:
     st.subheader("Churn Risk Prediction")
 
     if has_churn_data(company_id, churn_df):
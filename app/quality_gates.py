@@ -12,13 +12,37 @@ import logging
 from pathlib import Path
 from typing import Optional, Tuple
 
+import numpy as np
 import pandas as pd
 import streamlit as st
 
+from app.data_loader import (
+    CACHE_TTL,
+    load_buildings,
+    load_companies,
+    load_scored_companies,
+    parse_json,
+)
 from app.exceptions import DataQualityError
 
 logger = logging.getLogger(__name__)
 
+# Files the startup gates depend on, relative to the data dir (including
+# the loaders' fallbacks). Missing files are part of the fingerprint too,
+# so creating one invalidates a cached result.
+STARTUP_VALIDATION_INPUTS = [
+    "scoring/scored_companies_final.csv",
+    "scoring/scored_companies.csv",
+    "processed/companies.csv",
+    "processed/golden_buildings.csv",
+    "processed/buildings.csv",
+    "processed/entity_resolution_log.csv",
+    "scoring/scoring_diagnostics.json",
+    # Industry exclusions drop and rerank scored companies before the gates run
+    "config/exclusions.yaml",
+]
+
+
 def validate_critical_field_completeness(scored_df: pd.DataFrame) -> None:
     """
     Validate that critical fields are ≥99% complete.
@@ -57,13 +81,18 @@ def validate_critical_field_completeness(scored_df: pd.DataFrame) -> None:
             'icp_fit_score'
         ])
 
+    # Completeness of every present critical field in one vectorized pass
+    present_fields = [field for field in critical_fields if field in scored_df.columns]
+    completeness_by_field = scored_df[present_fields].notna().mean(axis=0)
+
+    # Report the first failing field in declaration order
     for field in critical_fields:
-        if field not in scored_df.columns:
+        if field not in completeness_by_field.index:
             raise DataQualityError(
                 f"BLOCKING: Critical field '{field}' missing from scored_companies.csv"
             )
 
-        completeness = scored_df[field].notna().mean()
+        completeness = completeness_by_field[field]
 
         if completeness < 0.99:
             raise DataQualityError(
@@ -74,6 +103,24 @@ def validate_critical_field_completeness(scored_df: pd.DataFrame) -> None:
     logger.info("✓ Critical field completeness validation passed (all ≥99%)")
 
 
+def _summarize_duplicates(ids: pd.Series) -> Tuple[int, list]:
+    """
+    Count rows with a duplicated ID and sample the offending IDs.
+
+    One value_counts pass gives both numbers - no boolean mask over the
+    frame and no second hash of the column.
+
+    Args:
+        ids: ID column known to contain duplicates
+
+    Returns:
+        Tuple of (rows_with_duplicate_ids, up to 5 duplicated IDs)
+    """
+    counts = ids.value_counts(sort=False, dropna=False)
+    dupes = counts[counts > 1]
+    return int(dupes.sum()), dupes.index[:5].tolist()
+
+
 def validate_no_duplicates(scored_df: pd.DataFrame, buildings_df: pd.DataFrame) -> None:
     """
     Validate no duplicate company_id or building_id values.
@@ -89,19 +136,17 @@ def validate_no_duplicates(scored_df: pd.DataFrame, buildings_df: pd.DataFrame)
     """
     # Check company_id duplicates
     if not scored_df['company_id'].is_unique:
-        dupes = scored_df[scored_df['company_id'].duplicated(keep=False)]
-        sample = dupes['company_id'].head(5).tolist()
+        dupe_rows, sample = _summarize_duplicates(scored_df['company_id'])
         raise DataQualityError(
-            f"BLOCKING: {len(dupes)} duplicate company_ids in scored_companies.csv. "
+            f"BLOCKING: {dupe_rows} duplicate company_ids in scored_companies.csv. "
             f"Sample duplicates: {sample}"
         )
 
     # Check building_id duplicates
     if not buildings_df['building_id'].is_unique:
-        dupes = buildings_df[buildings_df['building_id'].duplicated(keep=False)]
-        sample = dupes['building_id'].head(5).tolist()
+        dupe_rows, sample = _summarize_duplicates(buildings_df['building_id'])
         raise DataQualityError(
-            f"BLOCKING: {len(dupes)} duplicate building_ids in buildings.csv. "
+            f"BLOCKING: {dupe_rows} duplicate building_ids in buildings.csv. "
             f"Sample duplicates: {sample}"
         )
 
@@ -126,25 +171,25 @@ def validate_join_integrity(
 
     Spec: §5.2 Incorrect Joins - BLOCKING
     """
-    # Check scored → companies (IDs already strings from data loaders)
-    scored_ids = set(scored_df['company_id'])
-    company_ids = set(companies_df['company_id'])
+    # Compare distinct IDs as pandas Indexes - the loaders store company_id
+    # as a category, so unique() only touches each distinct value once
+    company_ids = pd.Index(companies_df['company_id'].unique())
 
-    missing_from_companies = scored_ids - company_ids
-    if missing_from_companies:
-        sample = list(missing_from_companies)[:5]
+    # Check scored → companies (IDs already strings from data loaders)
+    missing_from_companies = pd.Index(scored_df['company_id'].unique()).difference(company_ids)
+    if missing_from_companies.size:
+        sample = missing_from_companies.tolist()[:5]
         raise DataQualityError(
-            f"BLOCKING: {len(missing_from_companies)} company_ids in scored_companies.csv "
+            f"BLOCKING: {missing_from_companies.size} company_ids in scored_companies.csv "
             f"not found in companies.csv. Sample: {sample}"
         )
 
     # Check buildings → companies (IDs already strings from data loaders)
-    building_company_ids = set(buildings_df['company_id'])
-    missing_building_companies = building_company_ids - company_ids
-    if missing_building_companies:
-        sample = list(missing_building_companies)[:5]
+    missing_building_companies = pd.Index(buildings_df['company_id'].unique()).difference(company_ids)
+    if missing_building_companies.size:
+        sample = missing_building_companies.tolist()[:5]
         raise DataQualityError(
-            f"BLOCKING: {len(missing_building_companies)} company_ids in buildings.csv "
+            f"BLOCKING: {missing_building_companies.size} company_ids in buildings.csv "
             f"not found in companies.csv. Sample: {sample}"
         )
 
@@ -168,17 +213,25 @@ def check_entity_resolution_quality(er_log_path: Path) -> Tuple[float, bool]:
         return 0.0, True
 
     try:
-        er_log = pd.read_csv(er_log_path)
+        # Only match_type is used - skip parsing the other columns. A callable
+        # usecols (unlike a list) tolerates the column being absent.
+        er_log = pd.read_csv(
+            er_log_path,
+            usecols=lambda col: col == 'match_type',
+            dtype={'match_type': 'category'}
+        )
 
         if 'match_type' not in er_log.columns:
             logger.warning("Entity resolution log missing 'match_type' column")
             return 0.0, True
 
-        orphan_rate = (er_log['match_type'] == 'unmatched').mean()
+        # Categorical equality compares the integer codes
+        unmatched = er_log['match_type'] == 'unmatched'
+        orphan_rate = unmatched.mean()
         passed = bool(orphan_rate < 0.10)
 
         if not passed:
-            orphan_count = (er_log['match_type'] == 'unmatched').sum()
+            orphan_count = unmatched.sum()
             logger.warning(
                 f"Entity resolution orphan rate is {orphan_rate:.1%} "
                 f"(threshold: <10%). {orphan_count} HubSpot records unmatched."
@@ -209,8 +262,7 @@ def validate_scoring_weights(diagnostics_path: Path) -> Tuple[bool, Optional[str
         return False, "Scoring diagnostics file not found"
 
     try:
-        with open(diagnostics_path) as f:
-            diagnostics = json.load(f)
+        diagnostics = parse_json(diagnostics_path.read_bytes())
 
         weight_sum = diagnostics.get('weight_validation', {}).get('sum')
 
@@ -244,9 +296,11 @@ def check_coordinate_coverage(buildings_df: pd.DataFrame) -> Tuple[float, bool]:
     """
     total = len(buildings_df)
 
-    # Count buildings with both lat and lon
-    has_coords = buildings_df['latitude'].notna() & buildings_df['longitude'].notna()
-    count_with_coords = has_coords.sum()
+    # Count buildings with both lat and lon - null masks on the raw arrays
+    # (no Series wrappers), ORed and counted in numpy
+    latitude = buildings_df['latitude'].to_numpy()
+    longitude = buildings_df['longitude'].to_numpy()
+    count_with_coords = total - int(np.count_nonzero(pd.isna(latitude) | pd.isna(longitude)))
 
     coverage_rate = count_with_coords / total if total > 0 else 0.0
     passed = bool(coverage_rate >= 0.80)
@@ -391,3 +445,73 @@ def run_startup_validation(
 
     logger.info("✓ All blocking gates passed")
     return results
+
+
+def _startup_inputs_fingerprint(data_dir: Path) -> Tuple:
+    """
+    Fingerprint the startup gate inputs by (path, mtime, size).
+
+    Args:
+        data_dir: Path to data directory
+
+    Returns:
+        Tuple of (relative_path, mtime_ns, size) per input, with None for
+        files that don't exist
+    """
+    fingerprint = []
+    for relative_path in STARTUP_VALIDATION_INPUTS:
+        try:
+            stat = (data_dir / relative_path).stat()
+            fingerprint.append((relative_path, stat.st_mtime_ns, stat.st_size))
+        except FileNotFoundError:
+            fingerprint.append((relative_path, None, None))
+    return tuple(fingerprint)
+
+
+@st.cache_resource(ttl=CACHE_TTL, show_spinner=False)
+def _cached_startup_validation(fingerprint: Tuple, data_dir: Path) -> dict:
+    """
+    Load the gate inputs and run the startup gates once per input fingerprint,
+    shared across sessions.
+
+    The frames are loaded inside the cached call, so a hit never touches
+    them - loading a cached frame still unpickles a fresh copy, which is
+    most of the cost of a new session. Failures raise and are not cached.
+
+    Args:
+        fingerprint: Result of _startup_inputs_fingerprint(data_dir)
+        data_dir: Path to data directory
+
+    Returns:
+        Dictionary with validation results
+    """
+    return run_startup_validation(
+        load_scored_companies(), load_companies(), load_buildings(), data_dir
+    )
+
+
+def run_startup_validation_cached(data_dir: Path) -> dict:
+    """
+    Run all quality gates unless they already passed for unchanged inputs.
+
+    Results are keyed on the (path, mtime, size) of every gate input, so a
+    new session only pays a few stat() calls while the data is unchanged -
+    the scored, companies and buildings frames are only loaded on a miss.
+    The TTL matches the data loaders so a result never outlives the frames
+    it was computed from.
+
+    Args:
+        data_dir: Path to data directory
+
+    Returns:
+        Dictionary with validation results (shared across sessions - treat
+        as read-only)
+
+    Raises:
+        DataLoadError: If a required file is missing
+        SchemaValidationError: If a required file is missing columns
+        DataQualityError: If any blocking gate fails
+
+    Spec: §4.5 Data Quality Gates
+    """
+    return _cached_startup_validation(_startup_inputs_fingerprint(data_dir), data_dir)
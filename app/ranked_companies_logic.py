@@ -7,10 +7,55 @@ Epic 5 (OWRKS-5.05)
 Spec: §2.3 (Entity Resolution), §2.5 (Ranking Invariants)
 """
 
-from typing import Dict, Optional
+from typing import Any, Callable, Dict, List, Optional, Union
 
+import numpy as np
 import pandas as pd
-import streamlit as st
+
+from app.components.empty_states import EMPTY_COMPANIES_MSG
+
+# Source value -> badge shown in the Source column (unknown sources shown as-is)
+SOURCE_BADGES = {'dataaxle': "🔵 DataAxle", 'manual': "🟢 Manual"}
+
+# Free-text display columns are stored in one contiguous Arrow buffer
+# instead of a Python object per row (pyarrow ships with streamlit)
+DISPLAY_STRING_DTYPE = 'string[pyarrow]'
+
+
+def _ranks_contiguous_when_sorted(naics: pd.Series, ranks: pd.Series) -> bool:
+    """
+    Check rank contiguity in a single pass when rows are sorted by segment.
+
+    With NAICS monotonic and integer ranks ascending inside each segment,
+    the ranks are contiguous exactly when every segment starts at 1 and each
+    step adds 0 (a tie) or 1.
+
+    Args:
+        naics: Segment column
+        ranks: Integer rank column
+
+    Returns:
+        True if the input is in that order and contiguous; False if it is
+        not in that order or the check fails
+    """
+    if not pd.api.types.is_integer_dtype(ranks) or not naics.is_monotonic_increasing:
+        return False
+
+    codes = naics.to_numpy()
+    values = ranks.to_numpy()
+    if len(values) == 0:
+        return True
+
+    new_segment = np.empty(len(values), dtype=bool)
+    new_segment[0] = True
+    np.not_equal(codes[1:], codes[:-1], out=new_segment[1:])
+
+    steps = np.diff(values)
+    within = ~new_segment[1:]
+    return bool(
+        (values[new_segment] == 1).all()
+        and ((steps[within] == 0) | (steps[within] == 1)).all()
+    )
 
 
 def validate_segment_rank_contiguity(df: pd.DataFrame) -> None:
@@ -32,14 +77,109 @@ def validate_segment_rank_contiguity(df: pd.DataFrame) -> None:
         # Skip validation if neither column exists
         return
 
-    for naics in df['primary_naics'].unique():
-        segment_df = df[df['primary_naics'] == naics]
-        ranks = sorted(segment_df[rank_col].unique())
-        expected_ranks = list(range(1, len(ranks) + 1))
+    ranks = df[rank_col]
 
-        assert ranks == expected_ranks, (
-            f"NAICS {naics}: Ranks {ranks} are not contiguous. Expected {expected_ranks}"
-        )
+    # Fast path for the usual upstream order (sorted by NAICS, then rank):
+    # one diff pass, no groupby. Only a pass returns early - anything else
+    # (unsorted input, nulls, a real gap) goes through the grouped check below
+    if _ranks_contiguous_when_sorted(df['primary_naics'], ranks):
+        return
+
+    # One grouped pass instead of a boolean mask per segment. The distinct
+    # ranks of a segment are exactly 1..k when there are no nulls, the
+    # smallest is 1 and the largest equals the distinct count (ties may
+    # share a rank). sort=False keeps first-appearance order so the first
+    # failing segment reported is the same one the per-segment loop hit.
+    stats = ranks.groupby(df['primary_naics'], sort=False, observed=True).agg(
+        ['min', 'max', 'nunique', 'count', 'size']
+    )
+    contiguous = (
+        (stats['count'] == stats['size'])
+        & (stats['min'] == 1)
+        & (stats['max'] == stats['nunique'])
+    )
+
+    # min/max/nunique only pin the values down for whole-number ranks
+    if not pd.api.types.is_integer_dtype(ranks):
+        whole = ranks.isna() | (ranks % 1 == 0)
+        contiguous &= whole.groupby(df['primary_naics'], sort=False, observed=True).all()
+
+    if contiguous.all():
+        return
+
+    # Build the detailed message for the first failing segment only
+    naics = contiguous.index[~contiguous.to_numpy()][0]
+    segment_ranks = sorted(ranks[(df['primary_naics'] == naics).to_numpy()].unique())
+    expected_ranks = list(range(1, len(segment_ranks) + 1))
+
+    raise AssertionError(
+        f"NAICS {naics}: Ranks {segment_ranks} are not contiguous. Expected {expected_ranks}"
+    )
+
+
+def _first_score_order_mismatch(df: pd.DataFrame, score_col: str, rank_col: str) -> Optional[Any]:
+    """
+    Find the first segment whose ranks don't follow score order.
+
+    Args:
+        df: DataFrame with 'primary_naics', score column, and rank column
+        score_col: Score column name
+        rank_col: Rank column name
+
+    Returns:
+        NAICS value of the first failing segment, or None if every segment's
+        ranks are exactly 1..k in score order
+    """
+    # Segment codes in first-appearance order (-1 = null NAICS, which the
+    # per-segment comparison never matched and so never checked)
+    segment_codes, segments = pd.factorize(df['primary_naics'])
+    in_segment = segment_codes >= 0
+    if not in_segment.any():
+        return None
+
+    segment_codes = segment_codes[in_segment]
+    scores = df[score_col].to_numpy(dtype=float)[in_segment]
+    ranks = df[rank_col].to_numpy(dtype=float)[in_segment]
+
+    # One global sort: segment, then score descending, using rank as
+    # tie-breaker so companies with identical scores keep a consistent
+    # rank order (nulls sort last, as with sort_values)
+    order = np.lexsort((ranks, -scores, segment_codes))
+    sorted_codes = segment_codes[order]
+
+    # Expected ranks restart at 1 at every segment boundary
+    positions = np.arange(sorted_codes.size)
+    is_start = np.r_[True, sorted_codes[1:] != sorted_codes[:-1]]
+    segment_start = np.maximum.accumulate(np.where(is_start, positions, 0))
+    mismatched = ranks[order] != positions - segment_start + 1
+
+    if not mismatched.any():
+        return None
+
+    return segments[sorted_codes[mismatched].min()]
+
+
+def _raise_score_order_error(df: pd.DataFrame, naics: Any, score_col: str, rank_col: str) -> None:
+    """
+    Raise the detailed score-order error for one segment.
+
+    Args:
+        df: DataFrame with 'primary_naics', score column, and rank column
+        naics: Failing NAICS segment
+        score_col: Score column name
+        rank_col: Rank column name
+
+    Raises:
+        AssertionError: Always
+    """
+    segment_df = df[df['primary_naics'] == naics].sort_values([score_col, rank_col], ascending=[False, True])
+
+    expected_ranks = list(range(1, len(segment_df) + 1))
+    actual_ranks = segment_df[rank_col].tolist()
+
+    raise AssertionError(
+        f"NAICS {naics}: Ranks {actual_ranks} don't match score order. Expected {expected_ranks}"
+    )
 
 
 def validate_rank_matches_score_order(df: pd.DataFrame) -> None:
@@ -64,20 +204,44 @@ def validate_rank_matches_score_order(df: pd.DataFrame) -> None:
         # Skip validation if required columns don't exist
         return
 
-    for naics in df['primary_naics'].unique():
-        segment_df = df[df['primary_naics'] == naics].copy()
+    naics = _first_score_order_mismatch(df, score_col, rank_col)
+    if naics is not None:
+        _raise_score_order_error(df, naics, score_col, rank_col)
 
-        # Sort by score descending, using rank as tie-breaker for stable sorting
-        # This ensures companies with identical scores maintain consistent rank order
-        segment_df = segment_df.sort_values([score_col, rank_col], ascending=[False, True])
 
-        # Expected ranks should be 1, 2, 3, ...
-        expected_ranks = list(range(1, len(segment_df) + 1))
-        actual_ranks = segment_df[rank_col].tolist()
+def validate_ranking_invariants(df: pd.DataFrame) -> None:
+    """
+    Validate contiguous ranks and score-ordered ranks in one pass.
 
-        assert actual_ranks == expected_ranks, (
-            f"NAICS {naics}: Ranks {actual_ranks} don't match score order. Expected {expected_ranks}"
-        )
+    Equivalent to validate_segment_rank_contiguity followed by
+    validate_rank_matches_score_order (same errors, same precedence). When
+    ranks match score order, every segment's ranks are exactly 1..k, which
+    already implies contiguity - so on valid data only the score-order sort
+    runs, and the contiguity check is only needed to pick the error message.
+
+    Args:
+        df: DataFrame with 'primary_naics', score column, and rank column
+
+    Raises:
+        AssertionError: If ranks are not contiguous or don't match score order
+
+    Spec: §2.5 Ranking Invariants - Contiguous ranks, Rank matches score order
+    """
+    score_col = 'final_score' if 'final_score' in df.columns else 'augmented_score'
+    rank_col = 'rank' if 'rank' in df.columns else 'segment_rank'
+
+    if score_col not in df.columns or rank_col not in df.columns:
+        # Score order can't be checked - contiguity still applies
+        validate_segment_rank_contiguity(df)
+        return
+
+    naics = _first_score_order_mismatch(df, score_col, rank_col)
+    if naics is None:
+        return
+
+    # Contiguity failures take precedence, as when the checks run separately
+    validate_segment_rank_contiguity(df)
+    _raise_score_order_error(df, naics, score_col, rank_col)
 
 
 def sort_by_score_within_segment(df: pd.DataFrame) -> pd.DataFrame:
@@ -96,10 +260,11 @@ def sort_by_score_within_segment(df: pd.DataFrame) -> pd.DataFrame:
     score_col = 'final_score' if 'final_score' in df.columns else 'augmented_score'
 
     # Sort by NAICS first, then by score descending within each NAICS
+    # sort_values already returns a new frame - no extra copy needed
     sorted_df = df.sort_values(
         ['primary_naics', score_col],
         ascending=[True, False]
-    ).copy()
+    )
 
     return sorted_df
 
@@ -116,12 +281,7 @@ def get_source_badge(source: str) -> str:
 
     Spec: Page requirements - Source badge per row
     """
-    if source == 'dataaxle':
-        return "🔵 DataAxle"
-    elif source == 'manual':
-        return "🟢 Manual"
-    else:
-        return source
+    return SOURCE_BADGES.get(source, source)
 
 
 def format_urgent_flags(count: int) -> str:
@@ -158,6 +318,32 @@ def format_action_flags(count: int) -> str:
     return "—"
 
 
+def _format_flag_counts(
+    counts: pd.Series,
+    formatter: Callable[[int], str]
+) -> pd.Categorical:
+    """
+    Format a column of flag counts for display.
+
+    Counts take a handful of distinct values, so each distinct count (NaN
+    included) is formatted once and rows only carry a category code -
+    O(unique) strings instead of one per row. The scalar formatter is used
+    for every label, so the text matches a per-row call exactly.
+
+    Args:
+        counts: Flag count series
+        formatter: format_urgent_flags or format_action_flags
+
+    Returns:
+        Categorical of display strings aligned with counts
+    """
+    codes, uniques = pd.factorize(counts, use_na_sentinel=False)
+    # Several counts can share a label (0, negatives and NaN all show "—")
+    labels = pd.Index([formatter(count) for count in uniques], dtype=object)
+    label_codes, categories = pd.factorize(labels)
+    return pd.Categorical.from_codes(label_codes[codes], categories)
+
+
 def format_research_indicator(has_research: bool) -> str:
     """
     Format research document indicator.
@@ -226,82 +412,153 @@ def get_filtered_count_message(filtered_count: int, total_count: int) -> str:
         return f"Showing {filtered_count} of {total_count} companies"
 
 
+def _format_one_decimal(values: pd.Series, missing: str, suffix: str = "") -> List[str]:
+    """
+    Format a numeric column as one-decimal strings, with a placeholder for nulls.
+
+    One comprehension over the plain float list - cheaper than apply, and
+    than np.char.mod / np.where, which round-trip through fixed-width
+    numpy strings.
+
+    Args:
+        values: Numeric series
+        missing: Display string for null values
+        suffix: Appended to every formatted value (e.g. "%")
+
+    Returns:
+        List of display strings aligned with values
+    """
+    floats = values.to_numpy(dtype=float, na_value=np.nan).tolist()
+    return [missing if x != x else f"{x:.1f}{suffix}" for x in floats]
+
+
+def _as_category(values: Any, length: int) -> pd.Categorical:
+    """
+    Convert a display column (array or scalar default) to a categorical.
+
+    Categories are inferred from the values, so unknown labels pass through
+    unchanged. A scalar becomes a single-category column without a factorize
+    pass, and an already-categorical array is returned as-is.
+
+    Args:
+        values: Array-like column values or a scalar broadcast to every row
+        length: Number of rows (used for scalars)
+
+    Returns:
+        Categorical of the given length
+    """
+    if isinstance(values, pd.Categorical):
+        return values
+    if pd.api.types.is_scalar(values):
+        return pd.Categorical.from_codes(np.zeros(length, dtype=np.int8), [values])
+    return pd.Categorical(values)
+
+
 def prepare_display_dataframe(
     df: pd.DataFrame,
-    penetration_map: Dict[str, float]
+    penetration_map: Union[Dict[str, float], pd.Series]
 ) -> pd.DataFrame:
     """
     Prepare dataframe for display with formatted columns.
 
     Args:
         df: Scored companies dataframe (already sorted by score)
-        penetration_map: Dictionary mapping company_id to penetration_rate
+        penetration_map: Mapping (dict or Series indexed by company_id) of
+            company_id to penetration_rate
 
     Returns:
         DataFrame formatted for display with global and segment ranks
     """
-    display_df = df.copy()
+    # Each column is computed once and the frame is built in a single
+    # constructor call - no per-column insert/consolidation. Series go in as
+    # their backing arrays (.array keeps categorical/extension dtypes) so the
+    # constructor does not try to align them on a possibly non-unique index.
 
-    # Add global rank based on current sort order (by augmented_score descending)
+    # Global rank based on current sort order (by augmented_score descending)
     # This gives the overall ranking across all segments
-    display_df['Global Rank'] = range(1, len(display_df) + 1)
+    global_rank = np.arange(1, len(df) + 1)
 
-    # Add display columns
-    display_df['Segment Rank'] = display_df['segment_rank'] if 'segment_rank' in display_df.columns else display_df['rank']
-    display_df['Company'] = display_df['company_name']
-    display_df['Channel'] = display_df['channel_id'] if 'channel_id' in display_df.columns else 'N/A'
+    segment_rank = (df['segment_rank'] if 'segment_rank' in df.columns else df['rank']).array
+    channel = df['channel_id'].array if 'channel_id' in df.columns else 'N/A'
 
-    # Add Scoring Path column (Epic 5 requirement)
-    display_df['Scoring Path'] = display_df['scoring_path'] if 'scoring_path' in display_df.columns else 'Prospect'
+    # Scoring Path column (Epic 5 requirement)
+    scoring_path = df['scoring_path'].array if 'scoring_path' in df.columns else 'Prospect'
 
     # Use final_score if available, fallback to augmented_score
-    score_col = 'final_score' if 'final_score' in display_df.columns else 'augmented_score'
-    display_df['Score'] = display_df[score_col].apply(lambda x: f"{x:.1f}" if pd.notna(x) else "—")
+    score_col = 'final_score' if 'final_score' in df.columns else 'augmented_score'
+    score = _format_one_decimal(df[score_col], "—")
 
     # Flags and indicators (may not exist in new schema)
-    if 'urgent_flags' in display_df.columns:
-        display_df['🚨'] = display_df['urgent_flags'].apply(format_urgent_flags)
+    if 'urgent_flags' in df.columns:
+        urgent = _format_flag_counts(df['urgent_flags'], format_urgent_flags)
     else:
-        display_df['🚨'] = "—"
+        urgent = "—"
 
-    if 'action_flags' in display_df.columns:
-        display_df['✅'] = display_df['action_flags'].apply(format_action_flags)
+    if 'action_flags' in df.columns:
+        action = _format_flag_counts(df['action_flags'], format_action_flags)
     else:
-        display_df['✅'] = "—"
+        action = "—"
 
-    if 'has_research_doc' in display_df.columns:
-        display_df['📄'] = display_df['has_research_doc'].apply(format_research_indicator)
+    if 'has_research_doc' in df.columns:
+        research = np.where(df['has_research_doc'].to_numpy(), "📄", "—")
     else:
-        display_df['📄'] = "—"
+        research = "—"
 
-    display_df['Penetration'] = display_df['company_id'].apply(
-        lambda cid: format_penetration_rate(cid, penetration_map)
-    )
+    # One hash lookup per row against a float Series (built once per call
+    # when a plain dict is passed)
+    if not isinstance(penetration_map, pd.Series):
+        penetration_map = pd.Series(penetration_map, dtype='float64')
+    rates = df['company_id'].map(penetration_map)
+    penetration = _format_one_decimal(rates, "—", suffix="%")
 
     # Keep Buildings as numeric for proper sorting
-    building_col = 'building_count' if 'building_count' in display_df.columns else 'location_employee_size'
-    if building_col in display_df.columns:
-        display_df['Buildings'] = display_df[building_col].fillna(0).astype(int)
+    building_col = 'building_count' if 'building_count' in df.columns else 'location_employee_size'
+    if building_col in df.columns:
+        buildings = df[building_col].fillna(0).astype(int).array
     else:
-        display_df['Buildings'] = 0
-
-    if 'source' in display_df.columns:
-        display_df['Source'] = display_df['source'].apply(get_source_badge)
+        buildings = 0
+
+    if 'source' in df.columns:
+        # Factorize once and badge the distinct sources only (a no-op
+        # conversion when source is already categorical). The NA slot goes
+        # through get_source_badge(None) like any other value, and code -1
+        # picks it up from the end of the list
+        source_cat = pd.Categorical(df['source'])
+        badges = [get_source_badge(value) for value in source_cat.categories]
+        badges.append(get_source_badge(None))
+        # Several sources can share a badge, so re-factorize the labels
+        badge_codes, badge_categories = pd.factorize(pd.Index(badges, dtype=object))
+        source = pd.Categorical.from_codes(badge_codes[source_cat.codes], badge_categories)
     else:
-        display_df['Source'] = "🔵 DataAxle"
+        source = "🔵 DataAxle"
 
-    # Select and order columns for display
+    # Columns in display order - the flag, research, Scoring Path, Channel and
+    # Source columns hold a handful of distinct labels, so they are stored as
+    # categories; the free-text columns use the Arrow string dtype
     # Include company_id as hidden column for row selection mapping
-    display_columns = [
-        'company_id', 'Global Rank', 'Segment Rank', 'Company', 'Scoring Path', 'Channel', 'Score', '🚨', '✅', '📄',
-        'Penetration', 'Buildings', 'Source'
-    ]
-
-    # Sort by final score descending by default
-    result_df = display_df[display_columns].copy()
-    result_df = result_df.sort_values('Score', ascending=False)
+    display_df = pd.DataFrame(
+        {
+            'company_id': df['company_id'].array,
+            'Global Rank': global_rank,
+            'Segment Rank': segment_rank,
+            'Company': pd.array(df['company_name'], dtype=DISPLAY_STRING_DTYPE),
+            'Scoring Path': _as_category(scoring_path, len(df)),
+            'Channel': _as_category(channel, len(df)),
+            'Score': pd.array(score, dtype=DISPLAY_STRING_DTYPE),
+            '🚨': _as_category(urgent, len(df)),
+            '✅': _as_category(action, len(df)),
+            '📄': _as_category(research, len(df)),
+            'Penetration': pd.array(penetration, dtype=DISPLAY_STRING_DTYPE),
+            'Buildings': buildings,
+            'Source': _as_category(source, len(df)),
+        },
+        index=df.index
+    )
 
-    return result_df
+    # No re-sort: df arrives in score order (Global Rank depends on it), and
+    # Score is a formatted string here, so sorting on it would be lexicographic
+    # ("9.5" above "10.0")
+    return display_df
 
 
 def handle_empty_results(df: pd.DataFrame) -> str:
@@ -317,7 +574,7 @@ def handle_empty_results(df: pd.DataFrame) -> str:
     Spec: Page requirements - Handle empty filtered results
     """
     if len(df) == 0:
-        return "No companies match the current filters. Try adjusting your selection."
+        return EMPTY_COMPANIES_MSG
     return ""
 
 
@@ -328,7 +585,7 @@ def get_empty_state_message() -> str:
     Returns:
         Empty state message string
     """
-    return "No companies match the current filters. Try adjusting your selection."
+    return EMPTY_COMPANIES_MSG
 
 
 def set_selected_company(company_id: str) -> None:
@@ -340,4 +597,7 @@ def set_selected_company(company_id: str) -> None:
 
     Spec: Page requirements - Make company name clickable
     """
+    # Imported here so the pure ranking/formatting helpers load without streamlit
+    import streamlit as st
+
     st.session_state.selected_company_id = company_id
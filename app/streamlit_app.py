@@ -22,14 +22,9 @@ if str(_project_root) not in sys.path:
 
 import streamlit as st
 
-from app.data_loader import (
-    get_data_dir,
-    load_buildings,
-    load_companies,
-    load_scored_companies,
-)
+from app.data_loader import get_data_dir
 from app.exceptions import DataLoadError, DataQualityError, SchemaValidationError
-from app.quality_gates import run_startup_validation
+from app.quality_gates import run_startup_validation_cached
 
 logger = logging.getLogger(__name__)
 
@@ -78,18 +73,11 @@ def run_data_validation():
         return  # Already validated this session
 
     try:
-        # Load required data files (Spec: §1.1)
-        with st.spinner("Loading data files..."):
-            scored_df = load_scored_companies()
-            companies_df = load_companies()
-            buildings_df = load_buildings()
-            data_dir = get_data_dir()
-
-        # Run all quality gates (blocking + non-blocking)
-        with st.spinner("Running quality gates..."):
-            validation_results = run_startup_validation(
-                scored_df, companies_df, buildings_df, data_dir
-            )
+        # Load required data files (Spec: §1.1) and run all quality gates
+        # (blocking + non-blocking) - the files are only read when the gates
+        # have not already run for the current inputs
+        with st.spinner("Loading data files and running quality gates..."):
+            validation_results = run_startup_validation_cached(get_data_dir())
 
         # Store validation results in session state
         st.session_state.validation_results = validation_results
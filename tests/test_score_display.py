@@ -0,0 +1,70 @@
+"""
+Tests for the vectorized score formatters in app.components.score_display.
+
+Each *_series formatter must print exactly what its scalar counterpart
+prints for the same value (Spec: §2.2 Score Display Invariants).
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.components.score_display import (
+    format_confidence,
+    format_confidence_series,
+    format_percentage,
+    format_percentage_series,
+    format_score,
+    format_score_series,
+)
+
+VALUES = [
+    # Zeros and values that round to zero
+    0, 0.0, -0.0, 0.004, -0.004, -0.001, 1e-9, -1e-9,
+    # Rounding boundaries
+    0.005, -0.005, 0.125, 0.135, 0.845, 0.855, 100.05,
+    # Ordinary values
+    0.5, 1.0, 39.99, 55.55, np.float64(12.34), np.float32(0.1), np.int64(7), True,
+    # Non-finite values
+    float('inf'), float('-inf'), np.float32('inf'), 1.7976931348623157e308,
+    # Missing values
+    None, float('nan'), np.nan, np.float32('nan'), pd.NA,
+    # Strings
+    '', '  ', 'abc', '55.55', ' 5 ', 'nan', 'inf',
+]
+
+FORMATTERS = [
+    pytest.param(format_score, format_score_series, {}, id='score'),
+    pytest.param(format_score, format_score_series, {'max_val': 1.0}, id='score-unit'),
+    pytest.param(format_percentage, format_percentage_series, {}, id='percentage'),
+    pytest.param(format_confidence, format_confidence_series, {}, id='confidence'),
+]
+
+
+@pytest.mark.parametrize('scalar, series, kwargs', FORMATTERS)
+def test_series_matches_scalar(scalar, series, kwargs):
+    expected = [scalar(value, **kwargs) for value in VALUES]
+
+    assert series(VALUES, **kwargs).tolist() == expected
+    assert series(pd.Series(VALUES, dtype=object), **kwargs).tolist() == expected
+
+
+@pytest.mark.parametrize('scalar, series, kwargs', FORMATTERS)
+def test_non_finite_prints_na(scalar, series, kwargs):
+    values = [float('inf'), float('-inf'), float('nan'), np.float32('nan')]
+
+    assert [scalar(value, **kwargs) for value in values] == ['N/A'] * 4
+    assert series(values, **kwargs).tolist() == ['N/A'] * 4
+
+
+def test_confidence_has_no_negative_zero():
+    values = [-0.0, -0.004, -0.005]
+
+    assert [format_confidence(value) for value in values] == ['0%'] * 3
+    assert format_confidence_series(values).tolist() == ['0%'] * 3
+
+
+def test_series_keeps_index():
+    values = pd.Series([0.5, None], index=['a', 'b'])
+
+    assert format_percentage_series(values).index.tolist() == ['a', 'b']